@@ -0,0 +1,16 @@
+"""Headless disk scheduling engines behind the disk scheduling GUI.
+
+Needs NumPy but neither tkinter nor matplotlib::
+
+    from disk import schedule
+    sequence, movement, metrics = schedule("SCAN", 50, [90, 12, 56, 77], 200, "right")
+"""
+
+from .array import LAYOUTS, map_blocks, simulate_array
+from .batched import fscan, n_step_scan
+from .compare import compare, comparison_table
+from .deadline import anticipatory, deadline
+from .dynamic import SeekModel, simulate_arrivals
+from .registry import ALGORITHMS, schedule
+from .sstf import sstf, sstf_order
+from .sweep import c_look, c_scan, fcfs, look, scan
@@ -0,0 +1,101 @@
+"""Arrays of independent disks fed from one logical block address space.
+
+Logical blocks are mapped to (device, cylinder) either by concatenation
+(JBOD) or by RAID-0 striping. Each device then runs its own queue through
+``simulate_arrivals``, and the devices are simulated in parallel worker
+processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .dynamic import SeekModel, simulate_arrivals
+
+LAYOUTS = ("JBOD", "RAID-0")
+
+
+def map_blocks(lbas, devices, cylinders, blocks_per_cylinder=1, layout="RAID-0", stripe=8):
+    """Vectorized logical block -> ``(device, cylinder)`` mapping.
+
+    JBOD fills device 0 before device 1 and so on. RAID-0 deals out
+    ``stripe``-block chunks round-robin across the devices; a trailing
+    partial stripe on each device is left unused.
+    """
+    if devices <= 0:
+        raise ValueError("Number of devices must be greater than 0.")
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown array layout: {layout}")
+    if layout == "RAID-0" and stripe <= 0:
+        raise ValueError("Stripe size must be greater than 0.")
+    lbas = np.asarray(lbas, dtype=np.int64)
+    capacity = cylinders * blocks_per_cylinder
+    if layout == "RAID-0":
+        capacity -= capacity % stripe
+    if len(lbas) and (lbas.min() < 0 or lbas.max() >= devices * capacity):
+        raise ValueError(f"Block addresses must be within the array (0-{devices * capacity - 1})")
+    if layout == "JBOD":
+        device, local = np.divmod(lbas, capacity)
+    else:
+        chunk, offset = np.divmod(lbas, stripe)
+        row, device = np.divmod(chunk, devices)
+        local = row * stripe + offset
+    return device, local // blocks_per_cylinder
+
+
+def _run_device(job):
+    algorithm, requests, head, cylinders, direction, model = job
+    return simulate_arrivals(algorithm, requests, head, cylinders, direction, model)
+
+
+def simulate_array(requests, devices, cylinders, blocks_per_cylinder=1, layout="RAID-0", stripe=8,
+                   algorithm="SSTF", head=0, direction="right", model=None, workers=None):
+    """Simulate ``(arrival_time, lba)`` requests on an array of ``devices`` disks.
+
+    Every device starts with its head at ``head`` and schedules its own
+    queue with ``algorithm``. ``workers`` caps the process pool (1 runs
+    everything in this process). Returns ``per_device`` summaries (each
+    with ``busy`` time and ``utilization`` over the array's makespan) and
+    an ``aggregate`` summary with throughput and response percentiles.
+    """
+    model = model or SeekModel()
+    arrival = np.asarray([r[0] for r in requests], dtype=np.float64)
+    device, cylinder = map_blocks([r[1] for r in requests], devices, cylinders,
+                                  blocks_per_cylinder, layout, stripe)
+    jobs = []
+    for d in range(devices):
+        mine = np.flatnonzero(device == d)
+        jobs.append((algorithm, list(zip(arrival[mine].tolist(), cylinder[mine].tolist())),
+                     head, cylinders, direction, model))
+
+    if workers == 1 or devices == 1:
+        results = [_run_device(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_device, jobs))
+
+    n = len(arrival)
+    makespan = 0.0
+    if n:
+        makespan = float(max(r["completion"].max() for r in results if len(r["completion"])) - arrival.min())
+    per_device = []
+    for d, r in enumerate(results):
+        busy = float((r["completion"] - r["start"]).sum())
+        summary = dict(r["summary"], device=d, busy=busy,
+                       utilization=busy / makespan if makespan else 0.0)
+        per_device.append(summary)
+
+    aggregate = {"requests": n, "devices": devices, "layout": layout, "makespan": makespan,
+                 "movement": sum(s["movement"] for s in per_device)}
+    if n:
+        response = np.concatenate([r["response"] for r in results])
+        p50, p95, p99 = np.percentile(response, (50, 95, 99))
+        aggregate.update({
+            "throughput": n / makespan if makespan else 0.0,
+            "mean_response": float(response.mean()),
+            "p50_response": float(p50),
+            "p95_response": float(p95),
+            "p99_response": float(p99),
+            "mean_utilization": sum(s["utilization"] for s in per_device) / devices,
+        })
+    return {"per_device": per_device, "aggregate": aggregate}
@@ -0,0 +1,76 @@
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+import numpy as np
+
+# These schedulers take optional per-request ``arrivals``. The static engine
+# has no clock, so time is measured in cylinders of head movement: a request
+# can only be picked once the head has moved at least its arrival time.
+# Without arrivals every request is queued at time zero.
+
+
+def admission(requests, arrivals):
+    """Request indices in arrival order plus the arrival times as a list."""
+    n = len(requests)
+    if arrivals is None:
+        return list(range(n)), [0] * n
+    arrivals = np.asarray(arrivals)
+    if len(arrivals) != n:
+        raise ValueError("Mismatch in request and arrival time entries.")
+    return np.argsort(arrivals, kind="stable").tolist(), arrivals.tolist()
+
+
+def sweep_batch(head, batch, heading, disk_size):
+    """One elevator pass over ``batch``: ahead of the head, then edge and back.
+
+    Returns the cylinders visited and the heading afterwards. The edge is
+    only visited when requests remain behind the head.
+    """
+    ordered = sorted(batch)
+    cut = bisect_left(ordered, head) if heading == "right" else bisect_right(ordered, head)
+    upper, lower = ordered[cut:], ordered[:cut]
+    if heading == "right":
+        visits, behind, edge, turned = upper, lower[::-1], disk_size - 1, "left"
+    else:
+        visits, behind, edge, turned = lower[::-1], upper, 0, "right"
+    if not behind:
+        return visits, heading
+    if (visits[-1] if visits else head) != edge:
+        visits.append(edge)
+    return visits + behind, turned
+
+
+def n_step_scan(head, requests, disk_size, direction, n=4, arrivals=None):
+    """N-step SCAN: freeze the first ``n`` queued requests and sweep over them.
+
+    Requests arriving during a sweep wait for a later batch, so no request
+    can be overtaken indefinitely.
+    """
+    if n <= 0:
+        raise ValueError("N-step batch size must be greater than 0.")
+    cylinders = np.asarray(requests, dtype=np.int64).tolist()
+    order_in, arrival = admission(cylinders, arrivals)
+    queue = deque()
+    visits = []
+    time = 0
+    admitted = 0
+    heading = direction
+    while admitted < len(order_in) or queue:
+        while admitted < len(order_in) and arrival[order_in[admitted]] <= time:
+            queue.append(order_in[admitted])
+            admitted += 1
+        if not queue:
+            time = arrival[order_in[admitted]]
+            continue
+        batch = [queue.popleft() for _ in range(min(n, len(queue)))]
+        sweep, heading = sweep_batch(head, [cylinders[i] for i in batch], heading, disk_size)
+        for pos in sweep:
+            time += abs(pos - head)
+            head = pos
+        visits.extend(sweep)
+    return np.array(visits, dtype=np.int64)
+
+
+def fscan(head, requests, disk_size, direction, arrivals=None):
+    """FSCAN: sweep over everything queued; newcomers wait in a second queue."""
+    return n_step_scan(head, requests, disk_size, direction, n=len(requests) or 1, arrivals=arrivals)
@@ -0,0 +1,32 @@
+import numpy as np
+
+from .registry import result
+from .sstf import sstf_order
+from .sweep import split, sweep_orders
+
+CLASSIC = ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+
+def compare(head, requests, disk_size, direction="right"):
+    """Run all six algorithms on one batch, sorting the requests only once.
+
+    The SCAN/LOOK family is cut from a single sorted split around the head
+    and SSTF expands over the same sorted array. Returns
+    ``{algorithm: (sequence, movement, metrics)}`` in ``CLASSIC`` order,
+    as ``schedule`` would for each.
+    """
+    if direction not in ("left", "right"):
+        raise ValueError(f"Direction must be 'left' or 'right', not {direction!r}")
+    requests = np.asarray(requests, dtype=np.int64)
+    ordered = np.sort(requests)
+    orders = sweep_orders(*split(head, ordered, direction), disk_size, direction)
+    orders["FCFS"] = requests
+    # Already sorted, so SSTF's own sort is a linear pass
+    orders["SSTF"] = np.array(sstf_order(head, ordered.tolist(), direction=direction), dtype=np.int64)
+    n = len(requests)
+    return {name: result(head, orders[name], n) for name in CLASSIC}
+
+
+def comparison_table(results):
+    """Rows of (algorithm, total movement, average seek per request)."""
+    return [(name, movement, metrics["avg_seek_time"]) for name, (_, movement, metrics) in results.items()]
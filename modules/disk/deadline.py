@@ -0,0 +1,157 @@
+from collections import deque
+
+import numpy as np
+
+from .batched import admission
+from .dynamic import _CylinderQueue
+
+# Like batched.py, time is counted in cylinders of head movement and
+# ``arrivals`` (optional) says when each request joins the queue.
+
+
+def deadline(head, requests, disk_size, direction, writes=None, arrivals=None,
+             read_expire=500, write_expire=5000, fifo_batch=16, writes_starved=2):
+    """Linux-style Deadline scheduler.
+
+    Reads and writes each sit in a cylinder-sorted queue and a FIFO. Each
+    batch picks a data direction, reads first unless writes have been
+    passed over ``writes_starved`` times, then dispatches up to
+    ``fifo_batch`` requests in ascending cylinder order. It starts from the
+    oldest request when that one has waited past its expiry, otherwise from
+    the head position (wrapping to the lowest cylinder). Like the kernel it
+    only sweeps upwards, so ``direction`` is not used. The sorted queues are
+    Fenwick-indexed, so each dispatch costs O(log disk_size).
+    """
+    if fifo_batch <= 0:
+        raise ValueError("Deadline batch size must be greater than 0.")
+    cylinders = np.asarray(requests, dtype=np.int64).tolist()
+    n = len(cylinders)
+    is_write = [False] * n if writes is None else [bool(w) for w in writes]
+    if len(is_write) != n:
+        raise ValueError("Mismatch in request and write flag entries.")
+    order_in, arrival = admission(cylinders, arrivals)
+    expire = {False: read_expire, True: write_expire}
+    by_cylinder = {False: _CylinderQueue(disk_size), True: _CylinderQueue(disk_size)}
+    fifo = {False: deque(), True: deque()}
+    done = bytearray(n)
+    visits = []
+    time = 0
+    admitted = 0
+    starved = 0
+
+    def admit(upto):
+        nonlocal admitted
+        while admitted < n and arrival[order_in[admitted]] <= upto:
+            request = order_in[admitted]
+            by_cylinder[is_write[request]].push(cylinders[request], request)
+            fifo[is_write[request]].append(request)
+            admitted += 1
+
+    while len(visits) < n:
+        admit(time)
+        reads, writes_queued = len(by_cylinder[False]), len(by_cylinder[True])
+        if not reads and not writes_queued:
+            time = arrival[order_in[admitted]]
+            continue
+        if reads and (not writes_queued or starved < writes_starved):
+            kind = False
+            if writes_queued:
+                starved += 1
+        else:
+            kind = True
+            starved = 0
+
+        queue = by_cylinder[kind]
+        oldest = fifo[kind]
+        while done[oldest[0]]:
+            oldest.popleft()
+        first = oldest[0]
+        if arrival[first] + expire[kind] <= time:
+            cylinder = cylinders[first]
+        else:
+            cylinder = queue.at_or_above(head)
+            if cylinder is None:
+                cylinder = queue.lowest()
+
+        for _ in range(fifo_batch):
+            if cylinder is None:
+                break
+            request = queue.pop(cylinder)
+            done[request] = 1
+            time += abs(cylinder - head)
+            head = cylinder
+            visits.append(cylinder)
+            admit(time)
+            cylinder = queue.at_or_above(cylinder)
+    return np.array(visits, dtype=np.int64)
+
+
+def anticipatory(head, requests, disk_size, direction, writes=None, arrivals=None,
+                 window=6, near=None):
+    """SSTF that briefly idles after a read instead of seeking far away.
+
+    When a read completes and the nearest queued request is more than
+    ``near`` cylinders off (default 2% of the disk), the head idles until a
+    request within ``near`` arrives or ``window`` time units pass, then
+    serves the nearest request. It cannot see future arrivals, so the window
+    is wasted whenever no nearby request comes: idle time traded for shorter
+    seeks on bursty, local traces. Ties move on in the current direction.
+    """
+    cylinders = np.asarray(requests, dtype=np.int64).tolist()
+    n = len(cylinders)
+    is_write = [False] * n if writes is None else [bool(w) for w in writes]
+    if len(is_write) != n:
+        raise ValueError("Mismatch in request and write flag entries.")
+    if near is None:
+        near = max(1, disk_size // 50)
+    order_in, arrival = admission(cylinders, arrivals)
+    queue = _CylinderQueue(disk_size)
+    visits = []
+    time = 0
+    admitted = 0
+    heading = direction
+    last_was_read = False
+
+    while len(visits) < n:
+        while admitted < n and arrival[order_in[admitted]] <= time:
+            request = order_in[admitted]
+            queue.push(cylinders[request], request)
+            admitted += 1
+        if not len(queue):
+            time = arrival[order_in[admitted]]
+            continue
+
+        above = queue.at_or_above(head)
+        below = queue.at_or_below(head - 1) if head > 0 else None
+        gap_below = head - below if below is not None else None
+        gap_above = above - head if above is not None else None
+        nearest = min(g for g in (gap_below, gap_above) if g is not None)
+
+        if last_was_read and nearest > near:
+            # Idle as arrivals come in, until one lands near the head or the
+            # window runs out; then dispatch whatever is nearest
+            last_was_read = False
+            limit = time + window
+            time = limit
+            while admitted < n and arrival[order_in[admitted]] <= limit:
+                request = order_in[admitted]
+                queue.push(cylinders[request], request)
+                admitted += 1
+                if abs(cylinders[request] - head) <= near:
+                    time = arrival[request]
+                    break
+            continue
+
+        if gap_above is None or (gap_below is not None and (gap_below < gap_above or
+                                                           (gap_below == gap_above and heading == "left"))):
+            cylinder = below
+        else:
+            cylinder = above
+        request = queue.pop(cylinder)
+        if cylinder != head:
+            heading = "right" if cylinder > head else "left"
+        time += abs(cylinder - head)
+        head = cylinder
+        visits.append(cylinder)
+        last_was_read = not is_write[request]
+    return np.array(visits, dtype=np.int64)
@@ -0,0 +1,237 @@
+"""Time-driven disk simulation with requests arriving while the head moves.
+
+Requests are ``(arrival_time, cylinder)`` pairs. The simulator jumps from
+one service completion to the next, admitting whatever arrived meanwhile,
+so its cost is O(n log disk_size) regardless of how much time passes.
+"""
+
+from collections import deque, namedtuple
+
+import numpy as np
+
+
+class SeekModel(namedtuple("SeekModel", ["settle", "per_cylinder", "rotational", "transfer"],
+                           defaults=[1.0, 0.05, 4.17, 0.0])):
+    """Service-time model in milliseconds.
+
+    A seek of ``d`` cylinders costs ``settle + per_cylinder * d`` (nothing
+    when ``d`` is 0); every request then pays the average ``rotational``
+    latency plus ``transfer`` time.
+    """
+
+    __slots__ = ()
+
+    def seek(self, distance):
+        return self.settle + self.per_cylinder * distance if distance else 0.0
+
+
+class _CylinderQueue:
+    """Pending requests bucketed by cylinder.
+
+    A Fenwick tree counts requests per cylinder, so the nearest pending
+    cylinder at or beyond any point is found in O(log disk_size). Requests
+    on the same cylinder leave in arrival order.
+    """
+
+    def __init__(self, disk_size):
+        self.size = disk_size
+        self.tree = [0] * (disk_size + 1)
+        self.buckets = {}
+        self.count = 0
+        self.top = 1 << disk_size.bit_length()
+
+    def __len__(self):
+        return self.count
+
+    def _add(self, cylinder, delta):
+        i = cylinder + 1
+        tree = self.tree
+        while i <= self.size:
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, cylinder):
+        """Requests on cylinders 0..``cylinder``."""
+        i = cylinder + 1
+        total = 0
+        tree = self.tree
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _kth(self, k):
+        """Cylinder holding the ``k``-th pending request (1-based) in cylinder order."""
+        pos = 0
+        step = self.top
+        tree = self.tree
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and tree[nxt] < k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return pos
+
+    def push(self, cylinder, request):
+        self.buckets.setdefault(cylinder, deque()).append(request)
+        self._add(cylinder, 1)
+        self.count += 1
+
+    def pop(self, cylinder):
+        bucket = self.buckets[cylinder]
+        request = bucket.popleft()
+        if not bucket:
+            del self.buckets[cylinder]
+        self._add(cylinder, -1)
+        self.count -= 1
+        return request
+
+    def at_or_above(self, cylinder):
+        k = (self._prefix(cylinder - 1) if cylinder > 0 else 0) + 1
+        return self._kth(k) if k <= self.count else None
+
+    def at_or_below(self, cylinder):
+        k = self._prefix(cylinder)
+        return self._kth(k) if k else None
+
+    def lowest(self):
+        return self._kth(1) if self.count else None
+
+    def highest(self):
+        return self._kth(self.count) if self.count else None
+
+
+class _FifoQueue(deque):
+    def push(self, cylinder, request):
+        self.append(request)
+
+
+def _choose(algorithm, queue, head, heading, disk_size):
+    """Next cylinder to service.
+
+    Returns ``(cylinder, heading, path)`` where ``path`` lists the
+    cylinders the head passes through without servicing on the way there
+    (disk edges for SCAN/C-SCAN, the return jump for the circular variants).
+    """
+    if algorithm == "SSTF":
+        below, above = queue.at_or_below(head), queue.at_or_above(head)
+        if below is None:
+            return above, heading, ()
+        if above is None:
+            return below, heading, ()
+        gap_below, gap_above = head - below, above - head
+        if gap_below != gap_above:
+            return (above, heading, ()) if gap_above < gap_below else (below, heading, ())
+        return (above, heading, ()) if heading == "right" else (below, heading, ())
+
+    ahead = queue.at_or_above(head) if heading == "right" else queue.at_or_below(head)
+    if ahead is not None:
+        return ahead, heading, ()
+    edge, other_edge = (disk_size - 1, 0) if heading == "right" else (0, disk_size - 1)
+    back = "left" if heading == "right" else "right"
+    if algorithm == "LOOK":
+        return (queue.highest() if back == "left" else queue.lowest()), back, ()
+    if algorithm == "SCAN":
+        target = queue.highest() if back == "left" else queue.lowest()
+        return target, back, (edge,) if head != edge else ()
+    # Circular variants keep sweeping the same way after jumping back
+    target = queue.lowest() if heading == "right" else queue.highest()
+    if algorithm == "C-LOOK":
+        return target, heading, ()
+    path = (edge, other_edge) if head != edge else (other_edge,)
+    return target, heading, path
+
+
+def simulate_arrivals(algorithm, requests, head=0, disk_size=200, direction="right", model=None):
+    """Service a stream of ``(arrival_time, cylinder)`` requests.
+
+    Works with FCFS, SSTF, SCAN, C-SCAN, LOOK and C-LOOK over the live
+    queue; SSTF breaks ties towards the current direction. The head waits
+    where it is while the queue is empty. Returns a dict of per-request
+    NumPy arrays in input order (arrival, cylinder, start, completion,
+    response, wait), the service ``order`` as request indices, and a
+    ``summary`` with response-time percentiles, total movement, makespan
+    and throughput (requests per ms).
+    """
+    if algorithm not in ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"):
+        raise ValueError(f"Unknown disk scheduling algorithm: {algorithm}")
+    if direction not in ("left", "right"):
+        raise ValueError(f"Direction must be 'left' or 'right', not {direction!r}")
+    model = model or SeekModel()
+    arrival = np.asarray([r[0] for r in requests], dtype=np.float64)
+    cylinder = np.asarray([r[1] for r in requests], dtype=np.int64)
+    n = len(arrival)
+    if n and (cylinder.min() < 0 or cylinder.max() >= disk_size):
+        raise ValueError(f"Requests must be within the disk range (0-{disk_size - 1})")
+
+    by_arrival = np.argsort(arrival, kind="stable").tolist()
+    arrivals, cylinders = arrival.tolist(), cylinder.tolist()
+    start = [0.0] * n
+    completion = [0.0] * n
+    order = []
+    queue = _FifoQueue() if algorithm == "FCFS" else _CylinderQueue(disk_size)
+    per_request = model.rotational + model.transfer
+    seek = model.seek
+
+    time = 0.0
+    movement = 0
+    heading = direction
+    admitted = 0
+    while len(order) < n:
+        if not len(queue):
+            time = max(time, arrivals[by_arrival[admitted]])
+        while admitted < n and arrivals[by_arrival[admitted]] <= time:
+            request = by_arrival[admitted]
+            queue.push(cylinders[request], request)
+            admitted += 1
+
+        if algorithm == "FCFS":
+            request = queue.popleft()
+            target = cylinders[request]
+            path = ()
+        else:
+            target, heading, path = _choose(algorithm, queue, head, heading, disk_size)
+            request = queue.pop(target)
+
+        start[request] = time
+        for stop in path:
+            movement += abs(stop - head)
+            time += seek(abs(stop - head))
+            head = stop
+        distance = abs(target - head)
+        if distance and algorithm in ("FCFS", "SSTF"):
+            heading = "right" if target > head else "left"
+        movement += distance
+        time += seek(distance) + per_request
+        head = target
+        completion[request] = time
+        order.append(request)
+
+    start = np.asarray(start)
+    completion = np.asarray(completion)
+    response = completion - arrival
+    summary = {"requests": n, "movement": movement}
+    if n:
+        p50, p95, p99 = np.percentile(response, (50, 95, 99))
+        makespan = float(completion.max() - arrival.min())
+        summary.update({
+            "mean_response": float(response.mean()),
+            "p50_response": float(p50),
+            "p95_response": float(p95),
+            "p99_response": float(p99),
+            "max_response": float(response.max()),
+            "mean_wait": float((start - arrival).mean()),
+            "makespan": makespan,
+            "throughput": n / makespan if makespan else 0.0,
+        })
+    return {
+        "arrival": arrival,
+        "cylinder": cylinder,
+        "start": start,
+        "completion": completion,
+        "response": response,
+        "wait": start - arrival,
+        "order": np.asarray(order, dtype=np.int64),
+        "summary": summary,
+    }
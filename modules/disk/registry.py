@@ -0,0 +1,54 @@
+import numpy as np
+
+from .batched import fscan, n_step_scan
+from .deadline import anticipatory, deadline
+from .sstf import sstf
+from .sweep import c_look, c_scan, fcfs, look, scan
+
+# Every algorithm takes (head, requests, disk_size, direction, **options)
+# and returns the visit order after the head as an int64 array. The last
+# four also accept per-request ``arrivals`` (in cylinders of head movement);
+# DEADLINE and ANTICIPATORY take ``writes`` flags too.
+ALGORITHMS = {
+    "FCFS": fcfs,
+    "SSTF": sstf,
+    "SCAN": scan,
+    "C-SCAN": c_scan,
+    "LOOK": look,
+    "C-LOOK": c_look,
+    "N-STEP SCAN": n_step_scan,
+    "FSCAN": fscan,
+    "DEADLINE": deadline,
+    "ANTICIPATORY": anticipatory,
+}
+
+
+def schedule(algorithm, head, requests, disk_size, direction="right", **options):
+    """Seek sequence, total head movement and summary metrics.
+
+    ``requests`` may be any integer sequence or NumPy array. Returns
+    ``(sequence, movement, metrics)`` where ``sequence`` is an int64 array
+    starting at ``head`` and ``metrics`` holds total_requests, throughput
+    (requests per cylinder moved) and avg_seek_time (cylinders per request).
+    """
+    try:
+        engine = ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown disk scheduling algorithm: {algorithm}") from None
+    if direction not in ("left", "right"):
+        raise ValueError(f"Direction must be 'left' or 'right', not {direction!r}")
+    requests = np.asarray(requests, dtype=np.int64)
+    order = engine(head, requests, disk_size, direction, **options)
+    return result(head, order, len(requests))
+
+
+def result(head, order, n):
+    """``(sequence, movement, metrics)`` for a visit order of ``n`` requests."""
+    sequence = np.concatenate([[head], order]).astype(np.int64)
+    movement = int(np.abs(np.diff(sequence)).sum())
+    metrics = {
+        "total_requests": n,
+        "throughput": n / (movement if movement > 0 else 1),
+        "avg_seek_time": movement / n if n else 0,
+    }
+    return sequence, movement, metrics
@@ -0,0 +1,51 @@
+from bisect import bisect_left
+
+import numpy as np
+
+
+def sstf_order(initial_pos, requests, tie="direction", direction="right"):
+    """Shortest Seek Time First order of ``requests`` in O(n log n).
+
+    The requests are sorted once. Everything already serviced is then a
+    contiguous run around the head, so the next nearest request is always
+    one of the two neighbours just outside it: two pointers expand
+    outwards in O(1) per step. On equal distances ``tie`` picks the side:
+    "left", "right", or "direction" to keep moving the way the head last
+    went (starting with ``direction``).
+    """
+    if tie not in ("direction", "left", "right"):
+        raise ValueError(f"Unknown SSTF tie-break: {tie}")
+    ordered = sorted(requests)
+    right = bisect_left(ordered, initial_pos)
+    left = right - 1
+    heading = direction
+    current_pos = initial_pos
+    sequence = []
+    while left >= 0 or right < len(ordered):
+        if left < 0:
+            go_right = True
+        elif right >= len(ordered):
+            go_right = False
+        else:
+            left_gap = current_pos - ordered[left]
+            right_gap = ordered[right] - current_pos
+            if left_gap != right_gap:
+                go_right = right_gap < left_gap
+            else:
+                go_right = (heading if tie == "direction" else tie) == "right"
+        if go_right:
+            pos = ordered[right]
+            right += 1
+        else:
+            pos = ordered[left]
+            left -= 1
+        if pos != current_pos:
+            heading = "right" if pos > current_pos else "left"
+        current_pos = pos
+        sequence.append(pos)
+    return sequence
+
+
+def sstf(head, requests, disk_size, direction, tie="direction"):
+    requests = np.asarray(requests, dtype=np.int64).tolist()
+    return np.array(sstf_order(head, requests, tie, direction), dtype=np.int64)
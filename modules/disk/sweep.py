@@ -0,0 +1,75 @@
+import numpy as np
+
+# Every algorithm takes (head, requests, disk_size, direction) and returns
+# the cylinders visited after the starting head position, in order.
+
+
+def split(head, ordered, direction):
+    """Sorted requests cut at the head: (upper side, lower side), both ascending.
+
+    Moving right the head's own cylinder goes with the upper side; moving
+    left with the lower side, i.e. it is serviced on the first sweep
+    either way.
+    """
+    cut = np.searchsorted(ordered, head, side="left" if direction == "right" else "right")
+    return ordered[cut:], ordered[:cut]
+
+
+def _split(head, requests, direction):
+    return split(head, np.sort(requests), direction)
+
+
+def sweep_orders(upper, lower, disk_size, direction):
+    """SCAN, C-SCAN, LOOK and C-LOOK orders from one shared ``split``."""
+    return {name: order(upper, lower, disk_size, direction) for name, order in SWEEPS.items()}
+
+
+def fcfs(head, requests, disk_size, direction):
+    return np.asarray(requests, dtype=np.int64)
+
+
+def scan(head, requests, disk_size, direction):
+    upper, lower = _split(head, requests, direction)
+    return _scan(upper, lower, disk_size, direction)
+
+
+def _scan(upper, lower, disk_size, direction):
+    if direction == "right":
+        return np.concatenate([upper, [disk_size - 1], lower[::-1]])
+    return np.concatenate([lower[::-1], [0], upper])
+
+
+def c_scan(head, requests, disk_size, direction):
+    upper, lower = _split(head, requests, direction)
+    return _c_scan(upper, lower, disk_size, direction)
+
+
+def _c_scan(upper, lower, disk_size, direction):
+    if direction == "right":
+        return np.concatenate([upper, [disk_size - 1, 0], lower])
+    return np.concatenate([lower[::-1], [0, disk_size - 1], upper[::-1]])
+
+
+def look(head, requests, disk_size, direction):
+    upper, lower = _split(head, requests, direction)
+    return _look(upper, lower, disk_size, direction)
+
+
+def _look(upper, lower, disk_size, direction):
+    if direction == "right":
+        return np.concatenate([upper, lower[::-1]])
+    return np.concatenate([lower[::-1], upper])
+
+
+def c_look(head, requests, disk_size, direction):
+    upper, lower = _split(head, requests, direction)
+    return _c_look(upper, lower, disk_size, direction)
+
+
+def _c_look(upper, lower, disk_size, direction):
+    if direction == "right":
+        return np.concatenate([upper, lower])
+    return np.concatenate([lower[::-1], upper[::-1]])
+
+
+SWEEPS = {"SCAN": _scan, "C-SCAN": _c_scan, "LOOK": _look, "C-LOOK": _c_look}
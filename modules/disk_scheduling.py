@@ -9,6 +9,8 @@ from matplotlib.ticker import MaxNLocator
 import textwrap
 import tkinter.font as tkFont
 
+from disk import LAYOUTS, compare, comparison_table, schedule, simulate_array
+
 class DiskSchedulingVisualizer:
     def __init__(self, root):
         self.root = root
@@ -28,10 +30,10 @@ class DiskSchedulingVisualizer:
             },
             "SSTF": {
                 "description": "Shortest Seek Time First - Services the nearest request first",
-                "algorithm": "1. Start from initial head position\n2. Find request with minimum seek time\n3. Service that request\n4. Repeat until all requests are serviced",
+                "algorithm": "1. Start from initial head position\n2. Sort the requests once\n3. Compare the nearest pending request on each side of the head\n4. Service the closer one (ties keep the current direction)\n5. Repeat until all requests are serviced",
                 "advantages": "• Better performance than FCFS\n• Reduces average seek time",
                 "disadvantages": "• Can cause starvation\n• Not optimal for all cases",
-                "complexity": "Time: O(n^2)\nSpace: O(1)"
+                "complexity": "Time: O(n log n)\nSpace: O(n)"
             },
             "SCAN": {
                 "description": "Elevator Algorithm - Moves back and forth across the disk",
@@ -60,6 +62,34 @@ class DiskSchedulingVisualizer:
                 "advantages": "• Most efficient of SCAN variants\n• Minimal wasted movement",
                 "disadvantages": "• Slightly more complex to implement",
                 "complexity": "Time: O(n log n)\nSpace: O(1)"
+            },
+            "N-STEP SCAN": {
+                "description": "N-Step SCAN - Sweeps over fixed batches of N queued requests",
+                "algorithm": "1. Take the first N requests from the queue (N = 4)\n2. Service them with one SCAN pass\n3. Requests arriving meanwhile wait for a later batch\n4. Repeat with the next N requests",
+                "advantages": "• Bounded wait: no request can be passed over forever\n• Keeps most of SCAN's seek efficiency",
+                "disadvantages": "• Small N behaves like FCFS\n• Extra sweeps to the edge between batches",
+                "complexity": "Time: O(n log N)\nSpace: O(n)"
+            },
+            "FSCAN": {
+                "description": "Freeze SCAN - Sweeps over the queue as it stood when the sweep began",
+                "algorithm": "1. Freeze the current queue\n2. Service it with one SCAN pass\n3. New arrivals collect in a second queue\n4. Swap queues and repeat",
+                "advantages": "• Prevents arm stickiness from bursts at one cylinder\n• Predictable worst-case wait",
+                "disadvantages": "• New requests near the head still wait a full sweep",
+                "complexity": "Time: O(n log n)\nSpace: O(n)"
+            },
+            "DEADLINE": {
+                "description": "Deadline - Sorted elevator with read/write FIFO expiry times (Linux style)",
+                "algorithm": "1. Keep reads and writes in cylinder-sorted queues and FIFOs\n2. Prefer reads unless writes have starved too long\n3. Start a batch at the oldest request if it has expired, else at the head\n4. Dispatch up to 16 requests in ascending cylinder order\n5. Repeat",
+                "advantages": "• Bounded latency for every request\n• Reads are not stuck behind writes",
+                "disadvantages": "• Expired requests cause long seeks\n• Sweeps in one direction only",
+                "complexity": "Time: O(n log d) with cylinder-indexed queues (d = disk size)\nSpace: O(n + d)"
+            },
+            "ANTICIPATORY": {
+                "description": "Anticipatory - SSTF that waits briefly after a read for a nearby request",
+                "algorithm": "1. Service the nearest request\n2. After a read, if the next request is far away, idle until a nearby request arrives or a short window runs out\n3. Then service the nearest request",
+                "advantages": "• Fewer long seeks on bursty, sequential reads\n• Good for processes issuing dependent reads",
+                "disadvantages": "• Idle time wasted when no nearby request comes\n• Inherits SSTF's starvation risk",
+                "complexity": "Time: O(n log d) (d = disk size)\nSpace: O(n + d)"
             }
         }
 
@@ -114,6 +144,30 @@ class DiskSchedulingVisualizer:
                           bg="#4CAF50", fg="white", command=self.visualize)
         run_btn.grid(row=0, column=14, padx=10, pady=5)
 
+        compare_btn = tk.Button(header_frame, text="Compare All", font=("Helvetica", 12, "bold"),
+                              bg="#FF9800", fg="white", command=self.compare_all)
+        compare_btn.grid(row=0, column=15, padx=10, pady=5)
+
+        # Disk array (requests are read as logical block addresses)
+        tk.Label(header_frame, text="Devices:", font=("Helvetica", 12), bg="#f0f0f0").grid(row=1, column=2, padx=5, pady=5, sticky="w")
+        self.devices_entry = tk.Entry(header_frame, width=15)
+        self.devices_entry.grid(row=1, column=3, padx=5, pady=5)
+        self.devices_entry.insert(0, "4")
+
+        tk.Label(header_frame, text="Layout:", font=("Helvetica", 12), bg="#f0f0f0").grid(row=1, column=4, padx=5, pady=5, sticky="w")
+        self.layout_var = tk.StringVar(value="RAID-0")
+        ttk.Combobox(header_frame, textvariable=self.layout_var, values=list(LAYOUTS),
+                     width=12, state="readonly").grid(row=1, column=5, padx=5, pady=5)
+
+        tk.Label(header_frame, text="Stripe:", font=("Helvetica", 12), bg="#f0f0f0").grid(row=1, column=9, padx=5, pady=5, sticky="w")
+        self.stripe_entry = tk.Entry(header_frame, width=15)
+        self.stripe_entry.grid(row=1, column=10, padx=5, pady=5)
+        self.stripe_entry.insert(0, "8")
+
+        array_btn = tk.Button(header_frame, text="Simulate Array", font=("Helvetica", 12, "bold"),
+                              bg="#673AB7", fg="white", command=self.simulate_disk_array)
+        array_btn.grid(row=1, column=14, columnspan=2, padx=10, pady=5)
+
         # Visualization Frame (Main content)
         viz_container = tk.Frame(main_frame, bg="#ffffff")
         viz_container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -269,6 +323,140 @@ class DiskSchedulingVisualizer:
         except ValueError as e:
             messagebox.showerror("Input Error", str(e))
             
+    def compare_all(self):
+        """Run all six algorithms on the current inputs and chart their seek distances"""
+        try:
+            initial_pos = int(self.init_pos_entry.get())
+            requests = [int(x.strip()) for x in self.requests_entry.get().split(",")]
+            disk_size = int(self.disk_size_entry.get())
+            direction = self.direction_var.get()
+
+            if initial_pos < 0 or initial_pos >= disk_size:
+                raise ValueError(f"Initial position must be between 0 and {disk_size-1}")
+            for req in requests:
+                if req < 0 or req >= disk_size:
+                    raise ValueError(f"Request {req} is outside disk range (0-{disk_size-1})")
+
+            if self.canvas:
+                self.canvas.get_tk_widget().destroy()
+            if self.animation:
+                self.animation.event_source.stop()
+                self.animation = None
+            self.next_btn.pack_forget()
+            self.reset_btn.pack_forget()
+
+            rows = comparison_table(compare(initial_pos, requests, disk_size, direction))
+            self.show_comparison_table(rows)
+
+            names = [name for name, _, _ in rows]
+            movements = [movement for _, movement, _ in rows]
+            best = min(movements)
+            self.fig, ax = plt.subplots(figsize=(12, 6))
+            bars = ax.bar(names, movements, color=['#4CAF50' if m == best else '#4682B4' for m in movements],
+                          edgecolor='black')
+            for bar, (_, movement, avg_seek) in zip(bars, rows):
+                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height(), f"{movement}\n(avg {avg_seek:.2f})",
+                        ha='center', va='bottom', fontsize=10)
+            ax.set_ylabel("Total Head Movement (cylinders)")
+            ax.set_title(f"Algorithm Comparison ({len(requests)} requests, head at {initial_pos}, moving {direction})", pad=20)
+            ax.set_ylim(0, max(max(movements) * 1.2, 1))
+            ax.grid(True, axis='y', alpha=0.3)
+
+            self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
+            self.canvas.draw()
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+
+    def show_comparison_table(self, rows):
+        for widget in self.results_frame.winfo_children():
+            widget.destroy()
+
+        table = tk.Frame(self.results_frame, bg="#f0f0f0")
+        table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        headers = ("Algorithm", "Total Movement", "Avg Seek / Request")
+        for col, header in enumerate(headers):
+            tk.Label(table, text=header, font=("Arial", 12, "bold"), bg="#f0f0f0").grid(row=0, column=col, padx=10, sticky="w")
+        for row, (name, movement, avg_seek) in enumerate(rows, start=1):
+            for col, value in enumerate((name, f"{movement} cylinders", f"{avg_seek:.2f} cylinders")):
+                tk.Label(table, text=value, font=("Arial", 12), bg="#f0f0f0").grid(row=row, column=col, padx=10, sticky="w")
+
+    def simulate_disk_array(self):
+        """Spread the requests (as block addresses) over a disk array and chart per-device utilization"""
+        try:
+            algorithm = self.algo_var.get()
+            initial_pos = int(self.init_pos_entry.get())
+            blocks = [int(x.strip()) for x in self.requests_entry.get().split(",")]
+            disk_size = int(self.disk_size_entry.get())
+            devices = int(self.devices_entry.get())
+            stripe = int(self.stripe_entry.get())
+            layout = self.layout_var.get()
+            direction = self.direction_var.get()
+
+            if algorithm not in ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK"):
+                raise ValueError(f"{algorithm} is not supported in array mode")
+            if initial_pos < 0 or initial_pos >= disk_size:
+                raise ValueError(f"Initial position must be between 0 and {disk_size-1}")
+
+            result = simulate_array([(0.0, block) for block in blocks], devices, disk_size,
+                                    layout=layout, stripe=stripe, algorithm=algorithm,
+                                    head=initial_pos, direction=direction)
+
+            if self.canvas:
+                self.canvas.get_tk_widget().destroy()
+            if self.animation:
+                self.animation.event_source.stop()
+                self.animation = None
+            self.next_btn.pack_forget()
+            self.reset_btn.pack_forget()
+
+            self.show_array_table(result)
+
+            per_device = result["per_device"]
+            names = [f"Disk {d['device']}" for d in per_device]
+            utilization = [d["utilization"] * 100 for d in per_device]
+            self.fig, ax = plt.subplots(figsize=(12, 6))
+            bars = ax.bar(names, utilization, color='#673AB7', edgecolor='black')
+            for bar, d in zip(bars, per_device):
+                ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height(),
+                        f"{d['utilization']:.0%}\n({d['requests']} req)", ha='center', va='bottom', fontsize=10)
+            ax.set_ylabel("Utilization (%)")
+            ax.set_title(f"{layout} array of {devices} disks, {algorithm} per disk "
+                         f"({result['aggregate'].get('throughput', 0):.3f} req/ms overall)", pad=20)
+            ax.set_ylim(0, 115)
+            ax.grid(True, axis='y', alpha=0.3)
+
+            self.canvas = FigureCanvasTkAgg(self.fig, master=self.viz_frame)
+            self.canvas.draw()
+            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+
+    def show_array_table(self, result):
+        for widget in self.results_frame.winfo_children():
+            widget.destroy()
+
+        table = tk.Frame(self.results_frame, bg="#f0f0f0")
+        table.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        headers = ("Device", "Requests", "Movement", "Mean Response", "Utilization")
+        for col, header in enumerate(headers):
+            tk.Label(table, text=header, font=("Arial", 12, "bold"), bg="#f0f0f0").grid(row=0, column=col, padx=10, sticky="w")
+        for row, d in enumerate(result["per_device"], start=1):
+            values = (f"Disk {d['device']}", d["requests"], f"{d['movement']} cylinders",
+                      f"{d.get('mean_response', 0):.2f} ms", f"{d['utilization']:.1%}")
+            for col, value in enumerate(values):
+                tk.Label(table, text=value, font=("Arial", 12), bg="#f0f0f0").grid(row=row, column=col, padx=10, sticky="w")
+
+        aggregate = result["aggregate"]
+        values = ("Array", aggregate["requests"], f"{aggregate['movement']} cylinders",
+                  f"{aggregate.get('mean_response', 0):.2f} ms", f"{aggregate.get('throughput', 0):.3f} req/ms")
+        for col, value in enumerate(values):
+            tk.Label(table, text=value, font=("Arial", 12, "bold"), bg="#f0f0f0").grid(row=len(result["per_device"]) + 1, column=col, padx=10, sticky="w")
+
     def next_step(self):
         """Advance to the next step in manual mode"""
         if self.current_step < len(self.sequence) - 1:
@@ -386,87 +574,8 @@ class DiskSchedulingVisualizer:
         return self.disk_path, self.disk_pointer, self.chart_line, self.chart_points, self.chart_current
             
     def calculate_sequence(self, algorithm, initial_pos, requests, disk_size, direction):
-        sequence = [initial_pos]
-        reqs = requests.copy()
-        current_pos = initial_pos
-        total_movement = 0
-        metrics = {
-            "total_requests": len(requests),
-            "throughput": 0,
-            "avg_seek_time": 0
-        }
-        
-        if algorithm == "FCFS":
-            for req in reqs:
-                total_movement += abs(req - current_pos)
-                current_pos = req
-                sequence.append(req)
-                
-        elif algorithm == "SSTF":
-            while reqs:
-                closest = min(reqs, key=lambda x: abs(x - current_pos))
-                total_movement += abs(closest - current_pos)
-                current_pos = closest
-                sequence.append(closest)
-                reqs.remove(closest)
-                
-        elif algorithm == "SCAN":
-            if direction == "right":
-                reqs_sorted = sorted([r for r in reqs if r >= current_pos])
-                reqs_sorted += [disk_size - 1] + sorted([r for r in reqs if r < current_pos], reverse=True)
-            else:
-                reqs_sorted = sorted([r for r in reqs if r <= current_pos], reverse=True)
-                reqs_sorted += [0] + sorted([r for r in reqs if r > current_pos])
-                
-            for pos in reqs_sorted:
-                total_movement += abs(pos - current_pos)
-                current_pos = pos
-                sequence.append(pos)
-                
-        elif algorithm == "C-SCAN":
-            if direction == "right":
-                reqs_sorted = sorted([r for r in reqs if r >= current_pos])
-                reqs_sorted += [disk_size - 1, 0] + sorted([r for r in reqs if r < current_pos])
-            else:
-                reqs_sorted = sorted([r for r in reqs if r <= current_pos], reverse=True)
-                reqs_sorted += [0, disk_size - 1] + sorted([r for r in reqs if r > current_pos], reverse=True)
-                
-            for pos in reqs_sorted:
-                total_movement += abs(pos - current_pos)
-                current_pos = pos
-                sequence.append(pos)
-                
-        elif algorithm == "LOOK":
-            if direction == "right":
-                reqs_sorted = sorted([r for r in reqs if r >= current_pos])
-                reqs_sorted += sorted([r for r in reqs if r < current_pos], reverse=True)
-            else:
-                reqs_sorted = sorted([r for r in reqs if r <= current_pos], reverse=True)
-                reqs_sorted += sorted([r for r in reqs if r > current_pos])
-                
-            for pos in reqs_sorted:
-                total_movement += abs(pos - current_pos)
-                current_pos = pos
-                sequence.append(pos)
-                
-        elif algorithm == "C-LOOK":
-            if direction == "right":
-                reqs_sorted = sorted([r for r in reqs if r >= current_pos])
-                reqs_sorted += sorted([r for r in reqs if r < current_pos])
-            else:
-                reqs_sorted = sorted([r for r in reqs if r <= current_pos], reverse=True)
-                reqs_sorted += sorted([r for r in reqs if r > current_pos], reverse=True)
-                
-            for pos in reqs_sorted:
-                total_movement += abs(pos - current_pos)
-                current_pos = pos
-                sequence.append(pos)
-        
-        # Calculate metrics
-        metrics["throughput"] = len(requests) / (total_movement if total_movement > 0 else 1)
-        metrics["avg_seek_time"] = total_movement / len(requests) if requests else 0
-        
-        return sequence, total_movement, metrics
+        sequence, total_movement, metrics = schedule(algorithm, initial_pos, requests, disk_size, direction)
+        return sequence.tolist(), total_movement, metrics
         
     def update_results(self, algorithm, sequence, total_movement, metrics):
         # Clear previous results
@@ -6,47 +6,23 @@ import matplotlib.patches as patches
 from matplotlib.patches import Patch
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-
-class Process:
-    def __init__(self, pid, arrival, burst, io_burst=0):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.io_burst = io_burst
-        self.start = None
-        self.completion = None
-        self.turnaround = None
-        self.waiting = None
+from scheduling import Process, TickTimeline, fcfs
+from scheduling.metrics import format_summary, summarize_processes
 
 
 def fcfs_dynamic(processes):
-    processes.sort(key=lambda p: (p.arrival, p.pid))
-    time = 0
-    timeline = []
-
-    for p in processes:
-        if time < p.arrival:
-            for idle in range(time, p.arrival):
-                timeline.append((idle, None, "CPU Idle (No process has arrived yet)"))
-            time = p.arrival
-
-        p.start = time
-        for _ in range(p.burst):
-            explanation = f"At time {time}: Process P{p.pid} selected (Arrival: {p.arrival})"
-            timeline.append((time, p.pid, explanation))
-            time += 1
-
-        if p.io_burst > 0:
-            for _ in range(p.io_burst):
-                explanation = f"At time {time}: I/O in progress for Process P{p.pid}"
-                timeline.append((time, None, explanation))
-                time += 1
+    processes, segments, _ = fcfs(processes)
+    arrivals = {p.pid: p.arrival for p in processes}
 
-        p.completion = time
-        p.turnaround = p.completion - p.arrival
-        p.waiting = p.turnaround - (p.burst + p.io_burst)
+    def describe(index, time):
+        _, _, pid, kind, _ = segments[index]
+        if kind == "CPU":
+            return (time, pid, f"At time {time}: Process P{pid} selected (Arrival: {arrivals[pid]})")
+        if kind == "IO":
+            return (time, None, f"At time {time}: I/O in progress for Process P{pid}")
+        return (time, None, "CPU Idle (No process has arrived yet)")
 
-    return processes, timeline
+    return processes, TickTimeline(segments, describe)
 
 
 def manual_gantt_stepper(timeline, processes):
@@ -221,14 +197,10 @@ class FCFSApp:
 
             result = "PID | Arrival | Burst | I/O | Start | Completion | Turnaround | Waiting\n"
             result += "-" * 75 + "\n"
-            total_tat = total_wt = 0
             for p in final_processes:
-                total_tat += p.turnaround
-                total_wt += p.waiting
                 result += f"{p.pid:3} | {p.arrival:7} | {p.burst:5} | {p.io_burst:3} | {p.start:5} | {p.completion:10} | {p.turnaround:10} | {p.waiting:7}\n"
 
-            result += f"\nAverage Turnaround Time: {total_tat / self.num:.2f}"
-            result += f"\nAverage Waiting Time   : {total_wt / self.num:.2f}"
+            result += "\n" + format_summary(summarize_processes(final_processes, timeline.segments))
 
             self.output_label.config(text=result)
 
@@ -0,0 +1,12 @@
+"""Headless contiguous memory allocation behind the memory allocation GUI.
+
+Pure Python, no tkinter or matplotlib::
+
+    from memory import Allocator
+    heap = Allocator([100, 500, 200, 300, 600], "Best Fit")
+    start = heap.allocate(212)
+    heap.free(start)
+"""
+
+from .allocator import POLICIES, Allocator
+from .trace import read_trace, replay
@@ -0,0 +1,162 @@
+"""Contiguous memory allocator with segregated free lists.
+
+Memory is a row of fixed blocks (partitions) laid out back to back. Free
+holes are indexed three ways: by start address (for coalescing), in a list
+sorted by ``(size, start)`` for O(log n) best and worst fit, and in
+power-of-two size classes ordered by address for first fit. Holes never
+coalesce across block boundaries.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+
+POLICIES = ("First Fit", "Best Fit", "Worst Fit")
+
+
+class Allocator:
+    """Allocate and free address ranges inside ``blocks``.
+
+    Ties go to the lowest address, so on a fresh set of blocks First, Best
+    and Worst Fit pick the same block the linear scans in the GUI did.
+    """
+
+    def __init__(self, blocks, policy="First Fit"):
+        self.policy = self._check(policy)
+        self.bases = []
+        self.capacity = 0
+        self.available = 0
+        self.failures = 0
+        self._hole = {}       # start -> size
+        self._hole_end = {}   # end -> start
+        self._by_size = []    # sorted (size, start)
+        self._classes = [[] for _ in range(64)]
+        self._nonempty = 0    # bit k set while size class k has holes
+        self._used = {}       # start -> size
+        for size in blocks:
+            if size < 0:
+                raise ValueError("Block sizes must not be negative.")
+            self.bases.append(self.capacity)
+            if size:
+                self._add(self.capacity, size)
+            self.capacity += size
+            self.available += size
+        self._starts = set(self.bases)
+
+    @staticmethod
+    def _check(policy):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown allocation algorithm: {policy}")
+        return policy
+
+    def _add(self, start, size):
+        self._hole[start] = size
+        self._hole_end[start + size] = start
+        insort(self._by_size, (size, start))
+        k = size.bit_length()
+        while k >= len(self._classes):
+            self._classes.append([])
+        insort(self._classes[k], start)
+        self._nonempty |= 1 << k
+
+    def _remove(self, start):
+        size = self._hole.pop(start)
+        del self._hole_end[start + size]
+        del self._by_size[bisect_left(self._by_size, (size, start))]
+        k = size.bit_length()
+        members = self._classes[k]
+        del members[bisect_left(members, start)]
+        if not members:
+            self._nonempty &= ~(1 << k)
+
+    def _first_fit(self, size):
+        # Holes in the request's own class may still be too small; every
+        # hole in a larger class fits, so only the lowest address counts.
+        k = size.bit_length()
+        found = None
+        for start in self._classes[k] if k < len(self._classes) else ():
+            if self._hole[start] >= size:
+                found = start
+                break
+        mask = self._nonempty >> (k + 1)
+        k += 1
+        while mask:
+            if mask & 1:
+                start = self._classes[k][0]
+                if found is None or start < found:
+                    found = start
+            mask >>= 1
+            k += 1
+        return found
+
+    def _best_fit(self, size):
+        i = bisect_left(self._by_size, (size, -1))
+        return self._by_size[i][1] if i < len(self._by_size) else None
+
+    def _worst_fit(self, size):
+        if not self._by_size or self._by_size[-1][0] < size:
+            return None
+        largest = self._by_size[-1][0]
+        return self._by_size[bisect_left(self._by_size, (largest, -1))][1]
+
+    def allocate(self, size, policy=None):
+        """Carve ``size`` units from the low end of a hole; None if nothing fits."""
+        if size <= 0:
+            raise ValueError("Allocation size must be greater than 0.")
+        policy = self.policy if policy is None else self._check(policy)
+        if policy == "First Fit":
+            start = self._first_fit(size)
+        elif policy == "Best Fit":
+            start = self._best_fit(size)
+        else:
+            start = self._worst_fit(size)
+        if start is None:
+            self.failures += 1
+            return None
+
+        hole = self._hole[start]
+        self._remove(start)
+        if hole > size:
+            self._add(start + size, hole - size)
+        self._used[start] = size
+        self.available -= size
+        return start
+
+    def free(self, start):
+        """Release the allocation at ``start``, merging it with adjacent holes."""
+        try:
+            size = self._used.pop(start)
+        except KeyError:
+            raise ValueError(f"No allocation at address {start}") from None
+        self.available += size
+        end = start + size
+        if end in self._hole and end not in self._starts:
+            size += self._hole[end]
+            self._remove(end)
+        if start in self._hole_end and start not in self._starts:
+            left = self._hole_end[start]
+            size += self._hole[left]
+            self._remove(left)
+            start = left
+        self._add(start, size)
+        return size
+
+    def block_of(self, address):
+        """Index of the block holding ``address``."""
+        return bisect_right(self.bases, address) - 1
+
+    def holes(self):
+        """Free ``(start, size)`` pairs in address order."""
+        return sorted(self._hole.items())
+
+    def stats(self):
+        largest = self._by_size[-1][0] if self._by_size else 0
+        return {
+            "capacity": self.capacity,
+            "used": self.capacity - self.available,
+            "free": self.available,
+            "allocations": len(self._used),
+            "holes": len(self._hole),
+            "largest_hole": largest,
+            "failures": self.failures,
+            # Share of free memory unusable by a request as big as all of it
+            "fragmentation": 1 - largest / self.available if self.available else 0.0,
+        }
@@ -0,0 +1,46 @@
+"""Replay allocation traces through an ``Allocator``.
+
+A trace is a sequence of ``("a", id, size)`` and ``("f", id)`` events. In
+text form that is one event per line, ``a 7 128`` or ``f 7``; blank lines
+and ``#`` comments are skipped.
+"""
+
+
+def read_trace(path):
+    """Yield allocation events from a text trace file."""
+    with open(path, "r") as f:
+        for number, line in enumerate(f, start=1):
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            if fields[0] == "a" and len(fields) == 3:
+                yield ("a", fields[1], int(fields[2]))
+            elif fields[0] == "f" and len(fields) == 2:
+                yield ("f", fields[1])
+            else:
+                raise ValueError(f"Bad trace event on line {number}: {line.strip()}")
+
+
+def replay(allocator, events):
+    """Run ``events`` through ``allocator`` and return its final stats.
+
+    Frees of ids whose allocation failed (or never happened) are ignored.
+    Adds ``requests``, ``frees`` and ``peak_used`` to ``allocator.stats()``.
+    """
+    live = {}
+    requests = frees = peak = 0
+    for event in events:
+        if event[0] == "a":
+            requests += 1
+            start = allocator.allocate(event[2])
+            if start is not None:
+                live[event[1]] = start
+                peak = max(peak, allocator.capacity - allocator.available)
+        else:
+            start = live.pop(event[1], None)
+            if start is not None:
+                allocator.free(start)
+                frees += 1
+    stats = allocator.stats()
+    stats.update(requests=requests, frees=frees, peak_used=peak)
+    return stats
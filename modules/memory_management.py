@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import math
 
+from memory import Allocator
+
 
 class MemoryAllocationVisualizer:
     def __init__(self, root):
@@ -20,6 +22,7 @@ class MemoryAllocationVisualizer:
         self.processes = []
         self.allocations = []
         self.block_allocations = []
+        self.allocator = None
         self.current_step = 0
 
         self.setup_ui()
@@ -86,6 +89,7 @@ class MemoryAllocationVisualizer:
         self.processes = []
         self.allocations = []
         self.block_allocations = []
+        self.allocator = None
         self.current_step = 0
         self.ax.clear()
         self.canvas.draw()
@@ -99,6 +103,7 @@ class MemoryAllocationVisualizer:
             self.block_allocations = [[] for _ in self.original_blocks]
             self.processes = [int(x) for x in self.process_input.get().split()]
             self.allocations = [-1] * len(self.processes)
+            self.allocator = Allocator(self.original_blocks)
         except:
             self.status_label.config(text="Invalid input format.", fg="red")
             return
@@ -135,23 +140,11 @@ class MemoryAllocationVisualizer:
         idx_to_allocate = -1
 
         if allocation_type in ["First Fit", "Best Fit", "Worst Fit"]:
-            if allocation_type == "First Fit":
-                for i, block in enumerate(self.blocks):
-                    if block >= process_size:
-                        idx_to_allocate = i
-                        break
-            elif allocation_type == "Best Fit":
-                best = float('inf')
-                for i, block in enumerate(self.blocks):
-                    if process_size <= block < best:
-                        best = block
-                        idx_to_allocate = i
-            elif allocation_type == "Worst Fit":
-                worst = -1
-                for i, block in enumerate(self.blocks):
-                    if block >= process_size and block > worst:
-                        worst = block
-                        idx_to_allocate = i
+            start = None
+            if process_size > 0:
+                start = self.allocator.allocate(process_size, allocation_type)
+            if start is not None:
+                idx_to_allocate = self.allocator.block_of(start)
 
             if idx_to_allocate != -1:
                 self.allocations[self.current_step] = idx_to_allocate
@@ -171,13 +164,19 @@ class MemoryAllocationVisualizer:
             num_pages = math.ceil(process_size / page_size)
             allocated_pages = 0
 
-            for i, block in enumerate(self.blocks):
-                while self.blocks[i] >= page_size and allocated_pages < num_pages:
-                    self.block_allocations[i].append((self.current_step, page_size))
-                    self.blocks[i] -= page_size
-                    allocated_pages += 1
-                if allocated_pages == num_pages:
+            # First fit one page at a time fills each block before moving on
+            while allocated_pages < num_pages:
+                try:
+                    start = self.allocator.allocate(page_size, "First Fit")
+                except ValueError:
+                    self.status_label.config(text="Invalid page size", fg="red")
+                    return
+                if start is None:
                     break
+                i = self.allocator.block_of(start)
+                self.block_allocations[i].append((self.current_step, page_size))
+                self.blocks[i] -= page_size
+                allocated_pages += 1
 
             if allocated_pages == num_pages:
                 self.status_label.config(text=f"Paged P{self.current_step}", fg="green")
@@ -191,17 +190,16 @@ class MemoryAllocationVisualizer:
             allocated = []
 
             for seg in [seg1, seg2]:
-                found = False
-                for i, block in enumerate(self.blocks):
-                    if block >= seg:
-                        self.block_allocations[i].append((self.current_step, seg))
-                        self.blocks[i] -= seg
-                        allocated.append(True)
-                        found = True
-                        break
-                if not found:
+                if seg <= 0:
+                    continue
+                start = self.allocator.allocate(seg, "First Fit")
+                if start is None:
                     allocated.append(False)
                     break
+                i = self.allocator.block_of(start)
+                self.block_allocations[i].append((self.current_step, seg))
+                self.blocks[i] -= seg
+                allocated.append(True)
 
             if all(allocated):
                 self.status_label.config(text=f"Segmented P{self.current_step}", fg="green")
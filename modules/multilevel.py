@@ -1,72 +1,45 @@
 import tkinter as tk
-from tkinter import messagebox, scrolledtext
+from tkinter import ttk, messagebox, scrolledtext
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import matplotlib.patches as patches
 
-class Process:
-    def __init__(self, pid, arrival, burst, queue_type):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.remaining = burst
-        self.queue_type = queue_type  # 0 = System (FCFS), 1 = User (RR)
-        self.start = None
-        self.completion = None
-        self.executions = []
-
-def multilevel_queue(processes, quantum_rr=4):
-    processes.sort(key=lambda p: p.arrival)
-    time = 0
-    timeline = []
-    queue0 = []
-    queue1 = []
-    i = 0
-    n = len(processes)
-    log = []
-
-    while i < n or queue0 or queue1:
-        while i < n and processes[i].arrival <= time:
-            log.append(f"Time {time}: Process P{processes[i].pid} arrived (Queue: {processes[i].queue_type})")
-            if processes[i].queue_type == 0:
-                queue0.append(processes[i])
-            else:
-                queue1.append(processes[i])
-            i += 1
-
-        if queue0:
-            curr = queue0.pop(0)
-            if curr.start is None:
-                curr.start = time
-            explanation = f"At time {time}: P{curr.pid} selected from Queue 0 (FCFS)"
-            for _ in range(curr.burst):
-                timeline.append((time, curr.pid, explanation))
-                time += 1
-            curr.remaining = 0
-            curr.completion = time
-            curr.executions.append((curr.start, curr.completion))
-
-        elif queue1:
-            curr = queue1.pop(0)
-            if curr.start is None:
-                curr.start = time
-            explanation = f"At time {time}: P{curr.pid} selected from Queue 1 (Round Robin)"
-            exec_time = min(quantum_rr, curr.remaining)
-            for _ in range(exec_time):
-                timeline.append((time, curr.pid, explanation))
-                time += 1
-            curr.remaining -= exec_time
-            if curr.remaining > 0:
-                queue1.append(curr)
-            else:
-                curr.completion = time
-            curr.executions.append((time - exec_time, time))
-
+from scheduling import POLICIES, Process, TickTimeline
+from scheduling import multilevel_queue as multilevel_queue_engine
+from scheduling.metrics import format_summary, summarize_processes
+
+POLICY_NAMES = {"FCFS": "FCFS", "RR": "Round Robin", "SJF": "SJF", "PRIORITY": "Priority"}
+
+def multilevel_queue(processes, quantum_rr=4, levels=None, arbitration="priority", slices=None):
+    if levels is None:
+        # Classic two-level setup: system processes (FCFS) over user processes (RR)
+        levels = [{"type": "FCFS", "quantum": None}, {"type": "RR", "quantum": quantum_rr}]
+    processes, segments, log = multilevel_queue_engine(processes, levels, arbitration, slices)
+
+    def describe(index, time):
+        start, _, pid, kind, level = segments[index]
+        if kind == "IDLE":
+            return (time, None, "CPU Idle (No process available)")
+        return (time, pid, f"At time {start}: P{pid} selected from Queue {level} ({POLICY_NAMES[levels[level]['type']]})")
+
+    return processes, TickTimeline(segments, describe), log
+
+def parse_levels(text):
+    """Parse queue policies such as ``"FCFS RR:4 SJF PRIORITY"``."""
+    levels = []
+    for token in text.upper().split():
+        policy, _, quantum = token.partition(":")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown queue policy: {token}")
+        if policy == "RR":
+            if not quantum or int(quantum) <= 0:
+                raise ValueError("Round Robin queues need a positive quantum, e.g. RR:4")
+            levels.append({"type": "RR", "quantum": int(quantum)})
         else:
-            timeline.append((time, None, "CPU Idle (No process available)"))
-            time += 1
-
-    return processes, timeline, log
+            levels.append({"type": policy, "quantum": None})
+    if not levels:
+        raise ValueError("Enter at least one queue policy.")
+    return levels
 
 def visualize_timeline(timeline):
     fig, ax = plt.subplots(figsize=(max(10, len(timeline) // 2), 3.5))
@@ -95,75 +68,94 @@ def visualize_timeline(timeline):
 
 # --- GUI Section ---
 
-def run_scheduler():
-    try:
-        num = int(entry_num.get())
-        arrivals = list(map(int, entry_arrival.get().split()))
-        bursts = list(map(int, entry_burst.get().split()))
-        queues = list(map(int, entry_queue.get().split()))
-
-        if not (len(arrivals) == len(bursts) == len(queues) == num):
-            messagebox.showerror("Error", "Input lengths do not match number of processes.")
-            return
-
-        processes = [Process(i+1, arrivals[i], bursts[i], queues[i]) for i in range(num)]
-        scheduled, timeline, log = multilevel_queue(processes)
-
-        output.delete(1.0, tk.END)
-        output.insert(tk.END, "--- Execution Log ---\n")
-        for entry in log:
-            output.insert(tk.END, entry + "\n")
-
-        output.insert(tk.END, "\nPID | Arrival | Burst | Queue | Completion | Turnaround | Waiting\n")
-        total_tat = total_wt = 0
-        for p in scheduled:
-            tat = p.completion - p.arrival
-            wt = tat - p.burst
-            total_tat += tat
-            total_wt += wt
-            output.insert(tk.END, f"{p.pid:3} | {p.arrival:7} | {p.burst:5} | {p.queue_type:^5} | {p.completion:10} | {tat:10} | {wt:7}\n")
-
-        avg_tat = total_tat / num
-        avg_wt = total_wt / num
-        output.insert(tk.END, f"\nAverage Turnaround Time: {avg_tat:.2f}\n")
-        output.insert(tk.END, f"Average Waiting Time: {avg_wt:.2f}\n")
-
-        visualize_timeline(timeline)
+def main():
+    root = tk.Tk()
+    root.title("Multilevel Queue Scheduling GUI")
+    root.geometry("700x760")
+    root.configure(bg="#f0f0f0")
+
+    tk.Label(root, text="Enter Number of Processes:", bg="#f0f0f0", font=("Arial", 11)).pack()
+    entry_num = tk.Entry(root, width=50)
+    entry_num.pack()
+
+    tk.Label(root, text="Enter Arrival Times (space separated):", bg="#f0f0f0", font=("Arial", 11)).pack()
+    entry_arrival = tk.Entry(root, width=50)
+    entry_arrival.pack()
+
+    tk.Label(root, text="Enter Burst Times (space separated):", bg="#f0f0f0", font=("Arial", 11)).pack()
+    entry_burst = tk.Entry(root, width=50)
+    entry_burst.pack()
+
+    tk.Label(root, text="Enter Queue Numbers (0 = first queue):", bg="#f0f0f0", font=("Arial", 11)).pack()
+    entry_queue = tk.Entry(root, width=50)
+    entry_queue.pack()
+
+    tk.Label(root, text="Enter Priorities (only for PRIORITY queues, optional):", bg="#f0f0f0", font=("Arial", 11)).pack()
+    entry_priority = tk.Entry(root, width=50)
+    entry_priority.pack()
+
+    tk.Label(root, text="Queue Policies (FCFS, RR:<quantum>, SJF, PRIORITY):", bg="#f0f0f0", font=("Arial", 11)).pack()
+    entry_levels = tk.Entry(root, width=50)
+    entry_levels.insert(0, "FCFS RR:4")
+    entry_levels.pack()
+
+    tk.Label(root, text="Arbitration Between Queues:", bg="#f0f0f0", font=("Arial", 11)).pack()
+    arbitration_choice = ttk.Combobox(root, values=["Strict Priority", "Time Slice"], state="readonly", width=47)
+    arbitration_choice.set("Strict Priority")
+    arbitration_choice.pack()
+
+    tk.Label(root, text="Time Slice per Queue (only for Time Slice, space separated):", bg="#f0f0f0", font=("Arial", 11)).pack()
+    entry_slices = tk.Entry(root, width=50)
+    entry_slices.pack()
+
+    def run_scheduler():
+        try:
+            num = int(entry_num.get())
+            arrivals = list(map(int, entry_arrival.get().split()))
+            bursts = list(map(int, entry_burst.get().split()))
+            queues = list(map(int, entry_queue.get().split()))
+            priorities = list(map(int, entry_priority.get().split())) or [0] * num
+            levels = parse_levels(entry_levels.get())
+
+            if not (len(arrivals) == len(bursts) == len(queues) == len(priorities) == num):
+                messagebox.showerror("Error", "Input lengths do not match number of processes.")
+                return
+
+            if arbitration_choice.get() == "Time Slice":
+                arbitration = "timeslice"
+                slices = list(map(int, entry_slices.get().split()))
+                if any(s <= 0 for s in slices):
+                    raise ValueError("Time slices must be positive.")
+            else:
+                arbitration = "priority"
+                slices = None
 
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
+            processes = [Process(i+1, arrivals[i], bursts[i], priority=priorities[i], queue=queues[i]) for i in range(num)]
+            scheduled, timeline, log = multilevel_queue(processes, levels=levels, arbitration=arbitration, slices=slices)
 
-# Build GUI
-root = tk.Tk()
-root.title("Multilevel Queue Scheduling GUI")
-root.geometry("700x650")
-root.configure(bg="#f0f0f0")
+            output.delete(1.0, tk.END)
+            output.insert(tk.END, "--- Execution Log ---\n")
+            for entry in log:
+                output.insert(tk.END, entry + "\n")
 
-tk.Label(root, text="Enter Number of Processes:", bg="#f0f0f0", font=("Arial", 11)).pack()
-entry_num = tk.Entry(root, width=50)
-entry_num.pack()
+            output.insert(tk.END, "\nPID | Arrival | Burst | Queue | Completion | Turnaround | Waiting\n")
+            for p in scheduled:
+                tat = p.completion - p.arrival
+                wt = tat - p.burst
+                output.insert(tk.END, f"{p.pid:3} | {p.arrival:7} | {p.burst:5} | {p.queue:^5} | {p.completion:10} | {tat:10} | {wt:7}\n")
 
-tk.Label(root, text="Enter Arrival Times (space separated):", bg="#f0f0f0", font=("Arial", 11)).pack()
-entry_arrival = tk.Entry(root, width=50)
-entry_arrival.pack()
+            output.insert(tk.END, "\n" + format_summary(summarize_processes(scheduled, timeline.segments)) + "\n")
 
-tk.Label(root, text="Enter Burst Times (space separated):", bg="#f0f0f0", font=("Arial", 11)).pack()
-entry_burst = tk.Entry(root, width=50)
-entry_burst.pack()
+            visualize_timeline(timeline)
 
-tk.Label(root, text="Enter Queue Types (0 for FCFS, 1 for RR):", bg="#f0f0f0", font=("Arial", 11)).pack()
-entry_queue = tk.Entry(root, width=50)
-entry_queue.pack()
+        except Exception as e:
+            messagebox.showerror("Error", str(e))
 
-tk.Button(root, text="Run Scheduler", font=("Arial", 12, "bold"), bg="#4caf50", fg="white", command=run_scheduler).pack(pady=10)
+    tk.Button(root, text="Run Scheduler", font=("Arial", 12, "bold"), bg="#4caf50", fg="white", command=run_scheduler).pack(pady=10)
 
-output = scrolledtext.ScrolledText(root, width=80, height=20, font=("Courier", 10))
-output.pack(pady=10)
+    output = scrolledtext.ScrolledText(root, width=80, height=20, font=("Courier", 10))
+    output.pack(pady=10)
 
-root.mainloop()
-def main():
-    root = tk.Tk()
-    app = Process(root)
     root.mainloop()
 
 if __name__ == "__main__":
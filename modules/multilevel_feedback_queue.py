@@ -6,91 +6,19 @@ import matplotlib.patches as patches
 from matplotlib.patches import Patch
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-class Process:
-    def __init__(self, pid, arrival, burst):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.remaining = burst
-        self.queue_level = 0
-        self.start = None
-        self.completion = None
-        self.turnaround = None
-        self.waiting = None
+from scheduling import Process, TickTimeline, mlfq
+from scheduling.metrics import format_summary, summarize_processes
 
 def mlfq_custom_scheduler(processes, config):
-    processes.sort(key=lambda p: p.arrival)
-    time = 0
-    completed = 0
-    arrival_index = 0
-    timeline = []
-    queues = [[] for _ in range(len(config))]
-    n = len(processes)
-
-    while completed < n:
-        while arrival_index < n and processes[arrival_index].arrival <= time:
-            queues[0].append(processes[arrival_index])
-            timeline.append((time, None, f"Time {time}: Process P{processes[arrival_index].pid} arrived and added to Queue 0."))
-            arrival_index += 1
-
-        queue_found = False
-
-        for level, queue in enumerate(queues):
-            if not queue:
-                continue
-
-            queue_found = True
-            level_cfg = config[level]
-            sched_type = level_cfg["type"]
-
-            if sched_type == "RR":
-                queue.sort(key=lambda p: p.arrival)
-                curr = queue.pop(0)
-                quantum = level_cfg["quantum"]
-                exec_time = min(curr.remaining, quantum)
-            elif sched_type == "SJF":
-                queue.sort(key=lambda p: (p.remaining, p.arrival))
-                curr = queue.pop(0)
-                exec_time = curr.remaining
-            elif sched_type == "FCFS":
-                queue.sort(key=lambda p: p.arrival)
-                curr = queue.pop(0)
-                exec_time = curr.remaining
-
-            if curr.start is None:
-                curr.start = time
-
-            explanation = f"Time {time}: Executing P{curr.pid} from Queue {level} ({sched_type}) for {exec_time} units."
-
-            for _ in range(exec_time):
-                timeline.append((time, curr.pid, explanation))
-                time += 1
-                while arrival_index < n and processes[arrival_index].arrival <= time:
-                    queues[0].append(processes[arrival_index])
-                    timeline.append((time, None, f"Time {time}: Process P{processes[arrival_index].pid} arrived and added to Queue 0."))
-                    arrival_index += 1
-
-            curr.remaining -= exec_time
-
-            if curr.remaining == 0:
-                curr.completion = time
-                curr.turnaround = curr.completion - curr.arrival
-                curr.waiting = curr.turnaround - curr.burst
-                completed += 1
-            else:
-                if level + 1 < len(queues):
-                    curr.queue_level = level + 1
-                    queues[level + 1].append(curr)
-                    timeline.append((time, None, f"Time {time}: P{curr.pid} demoted to Queue {level + 1}."))
-                else:
-                    queues[level].append(curr)
-            break
+    processes, segments, log = mlfq(processes, config)
 
-        if not queue_found:
-            timeline.append((time, None, "CPU Idle"))
-            time += 1
+    def describe(index, time):
+        start, end, pid, kind, level = segments[index]
+        if kind == "IDLE":
+            return (time, None, "CPU Idle")
+        return (time, pid, f"Time {start}: Executing P{pid} from Queue {level} ({config[level]['type']}) for {end - start} units.")
 
-    return processes, timeline
+    return processes, TickTimeline(segments, describe), log
 
 def visualize_queues(timeline, queue_config, processes, avg_tat, avg_wt):
     num_levels = len(queue_config)
@@ -229,18 +157,21 @@ class MLFQApp:
             quantum = int(quantum_entry.get()) if algo == "RR" else None
             config.append({"type": algo, "quantum": quantum})
 
-        completed_processes, timeline = mlfq_custom_scheduler(processes, config)
-        avg_tat = sum(p.turnaround for p in completed_processes) / len(completed_processes)
-        avg_wt = sum(p.waiting for p in completed_processes) / len(completed_processes)
+        completed_processes, timeline, log = mlfq_custom_scheduler(processes, config)
+        stats = summarize_processes(completed_processes, timeline.segments)
+        avg_tat = stats["turnaround"]["mean"]
+        avg_wt = stats["waiting"]["mean"]
 
-        self.display_result_table(completed_processes, avg_tat, avg_wt)
+        self.display_result_table(completed_processes, stats, log)
         visualize_queues(timeline, config, completed_processes, avg_tat, avg_wt)
 
-    def display_result_table(self, processes, avg_tat, avg_wt):
+    def display_result_table(self, processes, stats, log):
         if hasattr(self, 'tree'):
             self.tree.destroy()
         if hasattr(self, 'result_label'):
             self.result_label.destroy()
+        if hasattr(self, 'log_text'):
+            self.log_text.destroy()
 
         result_frame = tk.Frame(self.root, padx=10, pady=10)
         result_frame.pack()
@@ -256,10 +187,18 @@ class MLFQApp:
 
         self.tree.pack()
 
-        self.result_label = tk.Label(result_frame, text=f"Average Turnaround Time: {avg_tat:.2f} | Average Waiting Time: {avg_wt:.2f}",
-                                     font=("Arial", 12, "bold"))
+        self.result_label = tk.Label(result_frame, text=format_summary(stats),
+                                     font=("Arial", 12, "bold"), justify='left')
         self.result_label.pack()
 
+        # Arrival and demotion messages from the engine
+        self.log_text = tk.Text(result_frame, height=8, width=80)
+        self.log_text.insert(tk.END, "--- Execution Log ---\n")
+        for entry in log:
+            self.log_text.insert(tk.END, entry + "\n")
+        self.log_text.config(state='disabled')
+        self.log_text.pack(pady=5)
+
 # Main Execution
 def main():
     root = tk.Tk()
@@ -5,62 +5,13 @@ from matplotlib import animation
 from matplotlib.patches import Patch, Rectangle
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-class Process:
-    def __init__(self, pid, arrival, burst, priority, io_burst=0):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.priority = priority
-        self.io_burst = io_burst
-        self.completion = 0
-        self.turnaround = 0
-        self.waiting = 0
-        self.timeline = []
+from scheduling import Process
+from scheduling import priority_non_preemptive as priority_non_preemptive_engine
+from scheduling.metrics import format_summary, summarize_processes
 
 def priority_non_preemptive(processes):
-    time = 0
-    completed = 0
-    n = len(processes)
-    ready_queue = []
-    timeline = []
-
-    processes.sort(key=lambda p: p.arrival)
-
-    while completed < n:
-        for p in processes:
-            if p.arrival <= time and p.completion == 0 and p not in ready_queue:
-                ready_queue.append(p)
-
-        ready_queue = [p for p in ready_queue if p.completion == 0]
-
-        if ready_queue:
-            ready_queue.sort(key=lambda p: (p.priority, p.arrival))
-            current = ready_queue.pop(0)
-
-            # CPU Execution
-            start = time
-            end = time + current.burst
-            timeline.append((current.pid, start, end, "CPU"))
-            current.timeline.append((start, end, "CPU"))
-            time = end
-
-            # I/O Execution if exists
-            if current.io_burst > 0:
-                io_start = time
-                io_end = time + current.io_burst
-                timeline.append((current.pid, io_start, io_end, "IO"))
-                current.timeline.append((io_start, io_end, "IO"))
-                time = io_end
-
-            current.completion = time
-            current.turnaround = current.completion - current.arrival
-            current.waiting = current.turnaround - (current.burst + current.io_burst)
-            completed += 1
-        else:
-            upcoming = [p.arrival for p in processes if p.completion == 0]
-            if upcoming:
-                time = min(upcoming)
-
+    processes, segments, _ = priority_non_preemptive_engine(processes)
+    timeline = [(pid, start, end, kind) for start, end, pid, kind, _ in segments if kind != "IDLE"]
     return processes, timeline
 
 class GanttChartVisualizer:
@@ -323,7 +274,7 @@ class PrioritySchedulerGUI:
             messagebox.showerror("Invalid Input", f"Please enter valid inputs: {str(e)}")
             return
 
-        self.processes = [Process(i + 1, arrival_times[i], burst_times[i], priorities[i], io_times[i]) for i in range(self.num_processes)]
+        self.processes = [Process(i + 1, arrival_times[i], burst_times[i], io_burst=io_times[i], priority=priorities[i]) for i in range(self.num_processes)]
         scheduled, timeline = priority_non_preemptive(self.processes)
 
         if self.result_frame:
@@ -338,18 +289,12 @@ class PrioritySchedulerGUI:
             tree.column(col, anchor='center', width=80 if col != "Priority" else 60)
         tree.pack(fill=tk.X)
 
-        total_tat, total_wt = 0, 0
         for p in scheduled:
-            total_tat += p.turnaround
-            total_wt += p.waiting
             tree.insert("", "end", values=(p.pid, p.arrival, p.burst, p.priority, p.io_burst, p.completion, p.turnaround, p.waiting))
 
-        avg_tat = total_tat / self.num_processes
-        avg_wt = total_wt / self.num_processes
-
         avg_label = tk.Label(self.result_frame, 
-                           text=f"Average Turnaround Time: {avg_tat:.2f} | Average Waiting Time: {avg_wt:.2f}", 
-                           font=("Arial", 12, "bold"), pady=10)
+                           text=format_summary(summarize_processes(scheduled)), 
+                           font=("Arial", 12, "bold"), pady=10, justify='left')
         avg_label.pack()
 
         # Show Gantt chart based on selected visualization type
@@ -1,10 +1,13 @@
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.patches import Patch
 
+from paging import (ARC, Clock, EnhancedClock, FIFO, LFU, LRU, MFU, Optimal, TwoQueue, WSClock, load_trace,
+                    lru_fault_curve, make, opt_fault_curve, read_trace, replay, simulate)
+
 class PageReplacementSimulator:
     def __init__(self, root):
         self.root = root
@@ -26,6 +29,11 @@ class PageReplacementSimulator:
             "Optimal": "Optimal: Replaces the page that will not be used for the longest period in the future.",
             "LFU": "LFU (Least Frequently Used): Replaces the page with the lowest access frequency.",
             "MFU": "MFU (Most Frequently Used): Replaces the page with the highest access frequency.",
+            "Clock": "Clock (Second Chance): A hand sweeps the frames, clearing reference bits, and replaces the first page whose bit is already clear.",
+            "Enhanced Clock": "Enhanced Clock: Uses reference and dirty bits (write pages as 3w); clean unreferenced pages go first and dirty ones are written back.",
+            "WSClock": "WSClock: Clock over the working set; only pages unused for more than τ references are replaced, dirty ones after a write-back.",
+            "ARC": "ARC (Adaptive Replacement Cache): Balances recency and frequency lists, using ghost lists of evicted pages to adapt the split.",
+            "2Q": "2Q: New pages wait in a FIFO queue and only move to the main LRU list when referenced again, so scans cannot flush hot pages.",
         }
  
         # Algorithm Description Label
@@ -39,7 +47,7 @@ class PageReplacementSimulator:
         input_frame = ttk.Frame(root)
         input_frame.pack(fill='x', pady=20)
 
-        ttk.Label(input_frame, text="Pages (space-separated):", font=font_medium).pack(side='left', padx=20)
+        ttk.Label(input_frame, text="Pages (space-separated, 3w = write):", font=font_medium).pack(side='left', padx=20)
         self.pages_entry = ttk.Entry(input_frame, width=40, font=font_medium)
         self.pages_entry.pack(side='left', padx=10)
 
@@ -47,6 +55,11 @@ class PageReplacementSimulator:
         self.frames_entry = ttk.Entry(input_frame, width=10, font=font_medium)
         self.frames_entry.pack(side='left', padx=10)
 
+        ttk.Label(input_frame, text="τ (WSClock):", font=font_medium).pack(side='left', padx=10)
+        self.tau_entry = ttk.Entry(input_frame, width=5, font=font_medium)
+        self.tau_entry.insert(0, "4")
+        self.tau_entry.pack(side='left', padx=10)
+
         ttk.Label(input_frame, text="Algorithm:", font=font_medium).pack(side='left', padx=10)
         self.algorithm_var = tk.StringVar(value="LRU")
         algo_combo = ttk.Combobox(input_frame, textvariable=self.algorithm_var,
@@ -57,6 +70,10 @@ class PageReplacementSimulator:
 
         ttk.Button(input_frame, text="Run Simulation", command=self.run_simulation,
                 style="Run.TButton").pack(side='left', padx=20)
+        ttk.Button(input_frame, text="Fault Curve", command=self.show_fault_curve,
+                style="Run.TButton").pack(side='left', padx=10)
+        ttk.Button(input_frame, text="Load Trace", command=self.run_trace,
+                style="Run.TButton").pack(side='left', padx=10)
 
         # Step Label
         self.step_text = tk.StringVar()
@@ -100,7 +117,7 @@ class PageReplacementSimulator:
             if not pages_input or not frames_input:
                 raise ValueError("Both pages and frames must be provided.")
 
-            self.pages = list(map(int, pages_input.split()))
+            self.pages, writes = self.parse_references(pages_input)
             num_frames = int(frames_input)
 
             if num_frames <= 0:
@@ -118,9 +135,37 @@ class PageReplacementSimulator:
                 self.steps, faults, self.memory_states = self.simulate_lfu(self.pages, num_frames)
             elif algorithm == "MFU":
                 self.steps, faults, self.memory_states = self.simulate_mfu(self.pages, num_frames)
+            elif algorithm == "Clock":
+                self.steps, faults, self.memory_states = self.simulate_clock(self.pages, num_frames)
+            elif algorithm == "Enhanced Clock":
+                self.steps, faults, self.memory_states, write_backs = self.simulate_enhanced_clock(
+                    self.pages, writes, num_frames)
+            elif algorithm == "WSClock":
+                tau = int(self.tau_entry.get().strip())
+                self.steps, faults, self.memory_states, write_backs = self.simulate_wsclock(
+                    self.pages, writes, num_frames, tau)
+            elif algorithm == "ARC":
+                self.steps, faults, self.memory_states, stats = self.simulate_arc(self.pages, num_frames)
+            elif algorithm == "2Q":
+                self.steps, faults, self.memory_states, stats = self.simulate_2q(self.pages, num_frames)
 
             self.output_text.delete(1.0, tk.END)
             self.output_text.insert(tk.END, f"Total Page Faults: {faults}\n")
+            if algorithm in ("Enhanced Clock", "WSClock"):
+                self.output_text.insert(tk.END, f"Dirty Page Write-backs: {write_backs}\n")
+            elif algorithm in ("ARC", "2Q"):
+                self.output_text.insert(tk.END, f"Hit Ratio: {stats['hit_ratio']:.2%}\n")
+                if algorithm == "ARC":
+                    ghosts = stats["ghost_hits"]
+                    self.output_text.insert(tk.END, f"Ghost Hits: B1 {ghosts['B1']}, B2 {ghosts['B2']}\n")
+                    self.output_text.insert(tk.END, f"Target T1 size p: {stats['p']:.2f} after "
+                                                    f"{stats['adaptations']} changes\n")
+                    recent = stats["adaptation"][-10:]
+                    if recent:
+                        trace = ", ".join(f"ref {i}: {p:.2f}" for i, p in recent)
+                        self.output_text.insert(tk.END, f"Last {len(recent)} changes: {trace}\n")
+                else:
+                    self.output_text.insert(tk.END, f"Ghost Hits (A1out): {stats['ghost_hits']}\n")
 
             self.current_step = 0
             self.next_button.config(state='normal')  # Enable the Next Step button
@@ -133,6 +178,109 @@ class PageReplacementSimulator:
         except Exception as e:
             messagebox.showerror("Error", f"Unexpected error:\n{e}")
 
+    def run_trace(self):
+        """Stream a reference string from a text or binary int32 file.
+
+        Only counters and a few sampled snapshots are kept, so traces far
+        larger than memory can be replayed.
+        """
+        path = filedialog.askopenfilename(
+            title="Select Reference Trace",
+            filetypes=[("Trace files", "*.txt *.bin *.i32 *.dat"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            frames_input = self.frames_entry.get().strip()
+            if not frames_input:
+                raise ValueError("Number of frames must be provided.")
+            num_frames = int(frames_input)
+            if num_frames <= 0:
+                raise ValueError("Number of frames must be greater than 0.")
+
+            algorithm = self.algorithm_var.get()
+            # The clock family tracks dirty pages, so keep the "w" markers for it
+            writes = algorithm in ("Enhanced Clock", "WSClock")
+            if algorithm == "Optimal":
+                # Optimal looks ahead, so the trace has to be fully available
+                pages = load_trace(path)
+                policy = Optimal(num_frames, pages)
+            else:
+                pages = read_trace(path, writes=writes)
+                options = {"tau": int(self.tau_entry.get().strip())} if algorithm == "WSClock" else {}
+                policy = make(algorithm, num_frames, **options)
+
+            stats = replay(policy, pages, sample_every=100000, window=10, writes=writes)
+
+            self.memory_states = []
+            self.next_button.config(state='disabled')
+            self.step_text.set(f"Trace replayed: {stats['references']} references")
+            self.output_text.delete(1.0, tk.END)
+            self.output_text.insert(tk.END, f"Trace: {path}\n")
+            self.output_text.insert(tk.END, f"Algorithm: {algorithm}, Frames: {num_frames}\n")
+            self.output_text.insert(tk.END, f"Total Page Faults: {stats['faults']}\n")
+            self.output_text.insert(tk.END, f"Fault Ratio: {stats['fault_ratio']:.2%}\n")
+            if "write_backs" in stats:
+                self.output_text.insert(tk.END, f"Dirty Page Write-backs: {stats['write_backs']}\n")
+            for i, page, step_type, memory in stats["samples"]:
+                shown = memory if len(memory) <= 20 else memory[:20] + ["..."]
+                self.output_text.insert(tk.END, f"Step {i} - Page: {page} -> {step_type}, Memory: {shown}\n")
+
+        except ValueError as ve:
+            messagebox.showerror("Input Error", str(ve))
+        except OSError as e:
+            messagebox.showerror("File Error", f"Could not read trace:\n{e}")
+
+    def parse_references(self, text):
+        """Split "1 3w 2" into pages [1, 3, 2] and write flags [False, True, False]."""
+        pages, writes = [], []
+        for token in text.split():
+            write = token[-1] in "wW"
+            try:
+                pages.append(int(token[:-1] if write else token))
+            except ValueError:
+                raise ValueError(f"Invalid page reference: {token}") from None
+            writes.append(write)
+        return pages, writes
+
+    def show_fault_curve(self):
+        """Plot LRU and OPT faults for 1..Frames frames from one pass each."""
+        try:
+            pages_input = self.pages_entry.get().strip()
+            frames_input = self.frames_entry.get().strip()
+
+            if not pages_input or not frames_input:
+                raise ValueError("Both pages and frames must be provided.")
+
+            pages, _ = self.parse_references(pages_input)
+            max_frames = int(frames_input)
+
+            if max_frames <= 0:
+                raise ValueError("Number of frames must be greater than 0.")
+
+            frame_counts = range(1, max_frames + 1)
+            lru = lru_fault_curve(pages, max_frames)
+            opt = opt_fault_curve(pages, max_frames)
+
+            self.next_button.config(state='disabled')
+            self.ax.clear()
+            self.ax.plot(frame_counts, lru, marker='o', label='LRU')
+            self.ax.plot(frame_counts, opt, marker='s', label='Optimal')
+            self.ax.set_xlabel("Frames")
+            self.ax.set_ylabel("Page Faults")
+            self.ax.set_title(f"Page Faults vs Frames ({len(pages)} references)")
+            self.ax.grid(True, linestyle='--', alpha=0.5)
+            self.ax.legend(loc='upper right')
+            self.canvas.draw()
+
+            self.step_text.set(f"Fault curve for 1 to {max_frames} frames")
+            self.output_text.delete(1.0, tk.END)
+            self.output_text.insert(tk.END, "Frames | LRU Faults | Optimal Faults\n")
+            for frames, lru_faults, opt_faults in zip(frame_counts, lru, opt):
+                self.output_text.insert(tk.END, f"{frames:6} | {lru_faults:10} | {opt_faults:14}\n")
+
+        except ValueError as ve:
+            messagebox.showerror("Input Error", str(ve))
+
     def next_step(self):
      if self.current_step >= len(self.memory_states):
         self.next_button.config(state='disabled')
@@ -179,149 +327,43 @@ class PageReplacementSimulator:
         self.output_text.see(tk.END)
 
     def simulate_lru(self, pages, num_frames):
-        memory = []
-        faults = 0
-        steps = []
-        states = []
-        for i, page in enumerate(pages):
-            hit = page in memory
-            if hit:
-                memory.remove(page)
-                memory.append(page)
-            else:
-                faults += 1
-                if len(memory) < num_frames:
-                    memory.append(page)
-                else:
-                    memory.pop(0)
-                    memory.append(page)
-            step_type = "Hit" if hit else "Fault"
-            steps.append(f"Step {i+1} - Page: {page} -> {step_type}, Memory: {memory}")
-            states.append((memory.copy(), page, step_type))
-        return steps, faults, states
+        return simulate(LRU(num_frames), pages, record=True)
 
     def simulate_fifo(self, pages, num_frames):
-        memory = []
-        pointer = 0
-        faults = 0
-        steps = []
-        states = []
-        for i, page in enumerate(pages):
-            hit = page in memory
-            if not hit:
-                faults += 1
-                if len(memory) < num_frames:
-                    memory.append(page)
-                else:
-                    memory[pointer] = page
-                    pointer = (pointer + 1) % num_frames
-            step_type = "Hit" if hit else "Fault"
-            steps.append(f"Step {i+1} - Page: {page} -> {step_type}, Memory: {memory}")
-            states.append((memory.copy(), page, step_type))
-        return steps, faults, states
+        return simulate(FIFO(num_frames), pages, record=True)
 
     def simulate_optimal(self, pages, num_frames):
-     memory = []
-     faults = 0
-     steps = []
-     states = []
-
-     for i, page in enumerate(pages):
-        if page in memory:
-            step_type = "Hit"
-        else:
-            faults += 1
-            step_type = "Fault"
-            if len(memory) < num_frames:
-                memory.append(page)
-            else:
-                # Predict future use of pages in memory
-                future_uses = []
-                for m_page in memory:
-                    if m_page in pages[i+1:]:
-                        future_uses.append(pages[i+1:].index(m_page))
-                    else:
-                        future_uses.append(float('inf'))  # Will not be used again
-
-                # Replace the page with the farthest future use
-                replace_index = future_uses.index(max(future_uses))
-                memory[replace_index] = page
-
-        steps.append(f"Step {i+1} - Page: {page} -> {step_type}, Memory: {memory}")
-        states.append((memory.copy(), page, step_type))
-
-     return steps, faults, states
+        return simulate(Optimal(num_frames, pages), pages, record=True)
 
 
     def simulate_lfu(self, pages, num_frames):
-     from collections import defaultdict, deque
-
-     memory = []
-     freq = defaultdict(int)
-     last_used = defaultdict(int)  # To break ties by recency if needed
-     faults = 0
-     steps = []
-     states = []
-
-     for i, page in enumerate(pages):
-        freq[page] += 1
-        last_used[page] = i
-        hit = page in memory
-
-        if not hit:
-            faults += 1
-            if len(memory) < num_frames:
-                memory.append(page)
-            else:
-                # Find the least frequently used page
-                min_freq = min(freq[p] for p in memory)
-                candidates = [p for p in memory if freq[p] == min_freq]
-                
-                # Break tie using least recently used (LRU strategy)
-                page_to_remove = min(candidates, key=lambda p: last_used[p])
-                memory.remove(page_to_remove)
-                memory.append(page)
-
-        step_type = "Hit" if hit else "Fault"
-        steps.append(f"Step {i+1} - Page: {page} -> {step_type}, Memory: {memory}")
-        states.append((memory.copy(), page, step_type))
-
-     return steps, faults, states
-
+        return simulate(LFU(num_frames), pages, record=True)
 
     def simulate_mfu(self, pages, num_frames):
-     from collections import defaultdict
-
-     memory = []
-     freq = defaultdict(int)
-     faults = 0
-     steps = []
-     states = []
-
-     for i, page in enumerate(pages):
-        freq[page] += 1
-        hit = page in memory
-
-        if not hit:
-            faults += 1
-            if len(memory) < num_frames:
-                memory.append(page)
-            else:
-                # Find the most frequently used page in memory
-                max_freq = -1
-                page_to_remove = None
-                for p in memory:
-                    if freq[p] > max_freq:
-                        max_freq = freq[p]
-                        page_to_remove = p
-                memory.remove(page_to_remove)
-                memory.append(page)
-
-        step_type = "Hit" if hit else "Fault"
-        steps.append(f"Step {i+1} - Page: {page} -> {step_type}, Memory: {memory}")
-        states.append((memory.copy(), page, step_type))
-
-     return steps, faults, states
+        return simulate(MFU(num_frames), pages, record=True)
+
+    def simulate_clock(self, pages, num_frames):
+        return simulate(Clock(num_frames), pages, record=True)
+
+    def simulate_enhanced_clock(self, pages, writes, num_frames):
+        policy = EnhancedClock(num_frames)
+        steps, faults, states = simulate(policy, pages, record=True, writes=writes)
+        return steps, faults, states, policy.write_backs
+
+    def simulate_wsclock(self, pages, writes, num_frames, tau):
+        policy = WSClock(num_frames, tau=tau)
+        steps, faults, states = simulate(policy, pages, record=True, writes=writes)
+        return steps, faults, states, policy.write_backs
+
+    def simulate_arc(self, pages, num_frames):
+        policy = ARC(num_frames)
+        steps, faults, states = simulate(policy, pages, record=True)
+        return steps, faults, states, policy.stats()
+
+    def simulate_2q(self, pages, num_frames):
+        policy = TwoQueue(num_frames)
+        steps, faults, states = simulate(policy, pages, record=True)
+        return steps, faults, states, policy.stats()
 
 def main():
     root = tk.Tk()
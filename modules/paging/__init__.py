@@ -0,0 +1,18 @@
+"""Headless page replacement policies shared by the simulator GUI.
+
+Nothing in this package imports tkinter or matplotlib::
+
+    from paging import make, simulate
+    _, faults, _ = simulate(make("LRU", 3), [7, 0, 1, 2, 0, 3, 0, 4])
+"""
+
+from .adaptive import ARC, TwoQueue
+from .clock import Clock, EnhancedClock, WSClock
+from .engine import simulate
+from .fifo import FIFO
+from .frequency import LFU, MFU
+from .lru import LRU
+from .optimal import Optimal, next_use
+from .registry import POLICIES, make
+from .stack import lru_fault_curve, opt_fault_curve
+from .trace import load_binary, load_trace, read_binary, read_text, read_trace, replay
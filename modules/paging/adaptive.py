@@ -0,0 +1,177 @@
+from collections import OrderedDict, deque
+
+
+class ARC:
+    """Adaptive Replacement Cache (Megiddo and Modha), O(1) per reference.
+
+    ``t1`` holds pages seen once recently and ``t2`` pages seen at least
+    twice; ``b1`` and ``b2`` remember the pages evicted from each. A hit in
+    a ghost list moves the target size ``p`` of ``t1`` towards the list that
+    would have kept the page, so a one-off scan only churns ``t1``.
+
+    ``adaptation`` keeps the last ``history`` ``(reference number, p)``
+    changes of ``p``, and ``adaptations`` counts all of them, so a long
+    trace does not grow the log without bound.
+    """
+
+    name = "ARC"
+
+    def __init__(self, frames, history=64):
+        if frames <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.frames = frames
+        self.p = 0.0
+        self.t1, self.t2 = OrderedDict(), OrderedDict()
+        self.b1, self.b2 = OrderedDict(), OrderedDict()
+        self.references = 0
+        self.hits = 0
+        self.ghost_hits = {"B1": 0, "B2": 0}
+        self.adaptation = deque(maxlen=history)
+        self.adaptations = 0
+
+    def access(self, page):
+        """Reference ``page``; returns True on a hit."""
+        self.references += 1
+        t1, t2, b1, b2 = self.t1, self.t2, self.b1, self.b2
+        c = self.frames
+
+        if page in t1:
+            del t1[page]
+            t2[page] = None
+            self.hits += 1
+            return True
+        if page in t2:
+            t2.move_to_end(page)
+            self.hits += 1
+            return True
+
+        if page in b1:
+            self.ghost_hits["B1"] += 1
+            self.adapt(min(c, self.p + max(len(b2) / len(b1), 1)))
+            self.replace(in_b2=False)
+            del b1[page]
+            t2[page] = None
+            return False
+        if page in b2:
+            self.ghost_hits["B2"] += 1
+            self.adapt(max(0.0, self.p - max(len(b1) / len(b2), 1)))
+            self.replace(in_b2=True)
+            del b2[page]
+            t2[page] = None
+            return False
+
+        if len(t1) + len(b1) == c:
+            if len(t1) < c:
+                b1.popitem(last=False)
+                self.replace(in_b2=False)
+            else:
+                t1.popitem(last=False)
+        else:
+            total = len(t1) + len(t2) + len(b1) + len(b2)
+            if total >= c:
+                if total == 2 * c:
+                    b2.popitem(last=False)
+                self.replace(in_b2=False)
+        t1[page] = None
+        return False
+
+    def replace(self, in_b2):
+        """Evict from ``t1`` or ``t2`` into its ghost list, steered by ``p``."""
+        t1 = self.t1
+        if t1 and ((in_b2 and len(t1) == self.p) or len(t1) > self.p):
+            page, _ = t1.popitem(last=False)
+            self.b1[page] = None
+        else:
+            page, _ = self.t2.popitem(last=False)
+            self.b2[page] = None
+
+    def adapt(self, p):
+        if p != self.p:
+            self.p = p
+            self.adaptations += 1
+            self.adaptation.append((self.references, p))
+
+    def stats(self):
+        return {
+            "references": self.references,
+            "hits": self.hits,
+            "hit_ratio": self.hits / self.references if self.references else 0.0,
+            "ghost_hits": dict(self.ghost_hits),
+            "p": self.p,
+            "adaptation": list(self.adaptation),
+            "adaptations": self.adaptations,
+        }
+
+    def snapshot(self):
+        """Resident pages: ``t1`` then ``t2``, each least recent first."""
+        return list(self.t1) + list(self.t2)
+
+
+class TwoQueue:
+    """Full 2Q (Johnson and Shasha), O(1) per reference.
+
+    New pages enter the FIFO ``a1in``. When it outgrows its share the
+    oldest page drops out and only its id is kept in ``a1out``. A page
+    referenced again while remembered there is promoted to the LRU list
+    ``am``, so pages touched once by a scan never displace the hot set.
+    ``kin`` and ``kout`` size ``a1in`` and ``a1out`` as fractions of the
+    frame count.
+    """
+
+    name = "2Q"
+
+    def __init__(self, frames, kin=0.25, kout=0.5):
+        if frames <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.frames = frames
+        self.kin = max(1, int(frames * kin))
+        self.kout = max(1, int(frames * kout))
+        self.a1in, self.a1out, self.am = OrderedDict(), OrderedDict(), OrderedDict()
+        self.references = 0
+        self.hits = 0
+        self.ghost_hits = 0
+
+    def access(self, page):
+        """Reference ``page``; returns True on a hit."""
+        self.references += 1
+        if page in self.am:
+            self.am.move_to_end(page)
+            self.hits += 1
+            return True
+        if page in self.a1in:
+            self.hits += 1
+            return True
+
+        if page in self.a1out:
+            self.ghost_hits += 1
+            del self.a1out[page]
+            self.reclaim()
+            self.am[page] = None
+        else:
+            self.reclaim()
+            self.a1in[page] = None
+        return False
+
+    def reclaim(self):
+        """Free a frame if memory is full."""
+        if len(self.a1in) + len(self.am) < self.frames:
+            return
+        if len(self.a1in) > self.kin or not self.am:
+            page, _ = self.a1in.popitem(last=False)
+            self.a1out[page] = None
+            if len(self.a1out) > self.kout:
+                self.a1out.popitem(last=False)
+        else:
+            self.am.popitem(last=False)
+
+    def stats(self):
+        return {
+            "references": self.references,
+            "hits": self.hits,
+            "hit_ratio": self.hits / self.references if self.references else 0.0,
+            "ghost_hits": self.ghost_hits,
+        }
+
+    def snapshot(self):
+        """Resident pages: ``a1in`` oldest first, then ``am`` least recent first."""
+        return list(self.a1in) + list(self.am)
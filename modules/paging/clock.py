@@ -0,0 +1,150 @@
+class Clock:
+    """Second-chance replacement with a circular buffer and a moving hand.
+
+    A hit only sets the page's reference bit. On a fault the hand clears
+    set bits as it sweeps and stops at the first clear one, so every step
+    past a page pays for a bit set earlier: O(1) amortized per reference.
+    """
+
+    name = "Clock"
+
+    def __init__(self, frames):
+        if frames <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.frames = frames
+        self.slots = []
+        self.slot_of = {}
+        self.referenced = bytearray(frames)
+        self.hand = 0
+
+    def access(self, page, write=False):
+        """Reference ``page``; returns True on a hit."""
+        slot = self.slot_of.get(page)
+        if slot is not None:
+            self.referenced[slot] = 1
+            return True
+        if len(self.slots) < self.frames:
+            slot = len(self.slots)
+            self.slots.append(page)
+        else:
+            slot = self.sweep()
+            del self.slot_of[self.slots[slot]]
+            self.slots[slot] = page
+        self.slot_of[page] = slot
+        self.referenced[slot] = 1
+        return False
+
+    def sweep(self):
+        """Advance the hand to a victim frame and step past it."""
+        referenced = self.referenced
+        while referenced[self.hand]:
+            referenced[self.hand] = 0
+            self.advance()
+        slot = self.hand
+        self.advance()
+        return slot
+
+    def advance(self):
+        self.hand += 1
+        if self.hand == self.frames:
+            self.hand = 0
+
+    def snapshot(self):
+        """Resident pages in frame order."""
+        return list(self.slots)
+
+
+class EnhancedClock(Clock):
+    """Clock over (reference, dirty) classes that counts write-backs.
+
+    The hand evicts the first page that is neither referenced nor dirty.
+    Referenced pages lose their bit as in Clock. Unreferenced dirty pages
+    are written back (counted in ``write_backs``) and become clean, so they
+    can go on the next revolution. Every skipped frame clears a bit, which
+    keeps the sweep O(1) amortized and finds a victim within two turns.
+    """
+
+    name = "Enhanced Clock"
+
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.dirty = bytearray(frames)
+        self.write_backs = 0
+
+    def access(self, page, write=False):
+        hit = super().access(page)
+        if write or not hit:
+            self.dirty[self.slot_of[page]] = write
+        return hit
+
+    def sweep(self):
+        referenced, dirty = self.referenced, self.dirty
+        while True:
+            hand = self.hand
+            if referenced[hand]:
+                referenced[hand] = 0
+            elif dirty[hand]:
+                dirty[hand] = 0
+                self.write_backs += 1
+            else:
+                self.advance()
+                return hand
+            self.advance()
+
+
+class WSClock(EnhancedClock):
+    """Working-set clock: only pages idle for more than ``tau`` references go.
+
+    Time is the reference count. Referenced pages get their bit cleared and
+    their last-use time set to now. An unreferenced page older than ``tau``
+    is evicted when clean and scheduled for write-back when dirty. If a
+    whole revolution finds nothing outside the working set and schedules no
+    write, the page under the hand is evicted anyway (written back first
+    when dirty).
+    """
+
+    name = "WSClock"
+
+    def __init__(self, frames, tau=4):
+        if tau <= 0:
+            raise ValueError("Working set window must be greater than 0.")
+        super().__init__(frames)
+        self.tau = tau
+        self.now = 0
+        self.last_use = [0] * frames
+
+    def access(self, page, write=False):
+        self.now += 1
+        hit = super().access(page, write)
+        if not hit:
+            self.last_use[self.slot_of[page]] = self.now
+        return hit
+
+    def sweep(self):
+        referenced, dirty, last_use = self.referenced, self.dirty, self.last_use
+        now, tau = self.now, self.tau
+        scanned = 0
+        written = False
+        while True:
+            hand = self.hand
+            if scanned == self.frames:
+                if not written:
+                    # Everything is in the working set: take the page under the hand
+                    if dirty[hand]:
+                        self.write_backs += 1
+                    break
+                scanned = 0
+                written = False
+            if referenced[hand]:
+                referenced[hand] = 0
+                last_use[hand] = now
+            elif now - last_use[hand] > tau:
+                if not dirty[hand]:
+                    break
+                dirty[hand] = 0
+                self.write_backs += 1
+                written = True
+            scanned += 1
+            self.advance()
+        self.advance()
+        return hand
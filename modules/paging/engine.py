@@ -0,0 +1,35 @@
+def simulate(policy, pages, record=False, writes=None):
+    """Feed ``pages`` to ``policy`` and count the page faults.
+
+    Returns ``(steps, faults, states)`` in the shape the simulator GUI
+    expects. Step text and memory snapshots cost O(frames) per reference,
+    so they are only built when ``record`` is true; otherwise both lists
+    come back empty and only the fault count is computed, through the
+    policy's own ``count_faults`` loop when it has one.
+
+    ``writes`` is an optional sequence of flags parallel to ``pages``
+    marking write references, for policies that track dirty pages.
+    """
+    access = policy.access
+    if not record:
+        if writes is None and hasattr(policy, "count_faults"):
+            return [], policy.count_faults(pages), []
+        hits = map(access, pages) if writes is None else map(access, pages, writes)
+        faults = 0
+        for hit in hits:
+            if not hit:
+                faults += 1
+        return [], faults, []
+
+    faults = 0
+    steps = []
+    states = []
+    for i, page in enumerate(pages):
+        hit = access(page) if writes is None else access(page, writes[i])
+        if not hit:
+            faults += 1
+        memory = policy.snapshot()
+        step_type = "Hit" if hit else "Fault"
+        steps.append(f"Step {i+1} - Page: {page} -> {step_type}, Memory: {memory}")
+        states.append((memory, page, step_type))
+    return steps, faults, states
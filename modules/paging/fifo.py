@@ -0,0 +1,35 @@
+class FIFO:
+    """First-in first-out replacement: the oldest loaded frame is reused.
+
+    Pages are replaced in place with a rotating pointer, so memory keeps
+    frame order and each reference is O(1).
+    """
+
+    name = "FIFO"
+
+    def __init__(self, frames):
+        if frames <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.frames = frames
+        self.slots = []
+        self.slot_of = {}
+        self.pointer = 0
+
+    def access(self, page):
+        """Reference ``page``; returns True on a hit."""
+        if page in self.slot_of:
+            return True
+        if len(self.slots) < self.frames:
+            self.slot_of[page] = len(self.slots)
+            self.slots.append(page)
+        else:
+            slot = self.pointer
+            del self.slot_of[self.slots[slot]]
+            self.slots[slot] = page
+            self.slot_of[page] = slot
+            self.pointer = (slot + 1) % self.frames
+        return False
+
+    def snapshot(self):
+        """Resident pages in frame order."""
+        return list(self.slots)
@@ -0,0 +1,157 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class _Bucket:
+    """All resident pages referenced ``freq`` times, least recent first."""
+
+    __slots__ = ("freq", "pages", "prev", "next")
+
+    def __init__(self, freq, prev=None, next=None):
+        self.freq = freq
+        self.pages = OrderedDict()
+        self.prev = prev
+        self.next = next
+
+
+class FrequencyPolicy(ABC):
+    """Shared bookkeeping for LFU and MFU.
+
+    Resident pages live in a doubly linked list of frequency buckets kept in
+    ascending order, so a reference moves its page to the neighbouring
+    bucket and the victim is always at one end of the list: O(1) per
+    reference whatever the frame count. Ties go to the least recently used
+    page. Counts only cover a page's current stay in memory and are dropped
+    on eviction.
+
+    With ``aging`` set, every ``aging`` references all counts are halved
+    (never below 1) so pages that were hot long ago can be evicted. The
+    rebuild costs O(frames log frames), so keep the period at least as
+    large as the frame count.
+    """
+
+    name = None
+
+    def __init__(self, frames, aging=None):
+        if frames <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        if aging is not None and aging <= 0:
+            raise ValueError("Aging period must be greater than 0.")
+        self.frames = frames
+        self.aging = aging
+        self.clock = 0
+        # page -> bucket, in load order for display
+        self.resident = {}
+        self.lowest = self.highest = None
+
+    def access(self, page):
+        """Reference ``page``; returns True on a hit."""
+        self.clock += 1
+        bucket = self.resident.get(page)
+        hit = bucket is not None
+        if hit:
+            self.promote(page, bucket)
+        else:
+            if len(self.resident) >= self.frames:
+                self.evict()
+            self.admit(page)
+        if self.aging and self.clock % self.aging == 0:
+            self.age()
+        return hit
+
+    @abstractmethod
+    def victim_bucket(self):
+        """The bucket the next victim is taken from: ``lowest`` or ``highest``."""
+
+    def evict(self):
+        bucket = self.victim_bucket()
+        page, _ = bucket.pages.popitem(last=False)
+        if not bucket.pages:
+            self.unlink(bucket)
+        del self.resident[page]
+        return page
+
+    def admit(self, page):
+        bucket = self.lowest
+        if bucket is None or bucket.freq != 1:
+            bucket = self.link_after(None, 1)
+        bucket.pages[page] = self.clock
+        self.resident[page] = bucket
+
+    def promote(self, page, bucket):
+        target = bucket.next
+        if target is None or target.freq != bucket.freq + 1:
+            target = self.link_after(bucket, bucket.freq + 1)
+        del bucket.pages[page]
+        target.pages[page] = self.clock
+        self.resident[page] = target
+        if not bucket.pages:
+            self.unlink(bucket)
+
+    def link_after(self, prev, freq):
+        """Insert an empty bucket after ``prev`` (at the front when None)."""
+        nxt = self.lowest if prev is None else prev.next
+        bucket = _Bucket(freq, prev, nxt)
+        if prev is None:
+            self.lowest = bucket
+        else:
+            prev.next = bucket
+        if nxt is None:
+            self.highest = bucket
+        else:
+            nxt.prev = bucket
+        return bucket
+
+    def unlink(self, bucket):
+        if bucket.prev is None:
+            self.lowest = bucket.next
+        else:
+            bucket.prev.next = bucket.next
+        if bucket.next is None:
+            self.highest = bucket.prev
+        else:
+            bucket.next.prev = bucket.prev
+
+    def age(self):
+        """Halve every count and rebuild the buckets, keeping recency order."""
+        entries = []
+        bucket = self.lowest
+        while bucket is not None:
+            freq = max(1, bucket.freq >> 1)
+            entries.extend((freq, stamp, page) for page, stamp in bucket.pages.items())
+            bucket = bucket.next
+        entries.sort()
+        self.lowest = self.highest = None
+        for freq, stamp, page in entries:
+            bucket = self.highest
+            if bucket is None or bucket.freq != freq:
+                bucket = self.link_after(bucket, freq)
+            bucket.pages[page] = stamp
+            self.resident[page] = bucket
+
+    def frequency(self, page):
+        """Current count of a resident page, or 0."""
+        bucket = self.resident.get(page)
+        return bucket.freq if bucket is not None else 0
+
+    def snapshot(self):
+        """Resident pages in the order they were loaded."""
+        return list(self.resident)
+
+
+class LFU(FrequencyPolicy):
+    """Evicts the least frequently used page."""
+
+    name = "LFU"
+
+    def victim_bucket(self):
+        return self.lowest
+
+
+class MFU(FrequencyPolicy):
+    """Evicts the most frequently used page."""
+
+    name = "MFU"
+
+    def victim_bucket(self):
+        return self.highest
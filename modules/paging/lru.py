@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+
+class LRU:
+    """Least recently used replacement in O(1) per reference.
+
+    The OrderedDict keeps resident pages from least to most recently used,
+    so a hit is a ``move_to_end`` and an eviction a ``popitem(last=False)``.
+    """
+
+    name = "LRU"
+
+    def __init__(self, frames):
+        if frames <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.frames = frames
+        self.memory = OrderedDict()
+
+    def access(self, page):
+        """Reference ``page``; returns True on a hit."""
+        memory = self.memory
+        if page in memory:
+            memory.move_to_end(page)
+            return True
+        if len(memory) >= self.frames:
+            memory.popitem(last=False)
+        memory[page] = None
+        return False
+
+    def count_faults(self, pages):
+        """``access`` over a whole reference string with the lookups hoisted."""
+        memory = self.memory
+        touch = memory.move_to_end
+        evict = memory.popitem
+        frames = self.frames
+        resident = len(memory)
+        faults = 0
+        for page in pages:
+            if page in memory:
+                touch(page)
+                continue
+            faults += 1
+            if resident >= frames:
+                evict(last=False)
+            else:
+                resident += 1
+            memory[page] = None
+        return faults
+
+    def snapshot(self):
+        """Resident pages, least recently used first."""
+        return list(self.memory)
@@ -0,0 +1,85 @@
+import heapq
+from array import array
+
+
+def next_use(pages):
+    """``result[i]`` is the next index after ``i`` where ``pages[i]`` recurs.
+
+    Pages that never recur get ``len(pages)``. Built in one reverse pass.
+    """
+    n = len(pages)
+    result = array("q", bytes(8 * n))
+    seen = {}
+    for i in range(n - 1, -1, -1):
+        page = pages[i]
+        result[i] = seen.get(page, n)
+        seen[page] = i
+    return result
+
+
+class Optimal:
+    """Belady's optimal replacement in O(log frames) per reference.
+
+    Needs the whole reference string up front, and ``access`` must then be
+    called with its pages in order. Resident pages sit in a max-heap keyed
+    by next use. A hit pushes a fresh entry and leaves the old one to be
+    skipped lazily; the heap is rebuilt once stale entries outnumber live
+    ones. Among pages that are never used again the lowest frame goes first,
+    as in the original list scan.
+    """
+
+    name = "Optimal"
+
+    def __init__(self, frames, pages):
+        if frames <= 0:
+            raise ValueError("Number of frames must be greater than 0.")
+        self.frames = frames
+        self.pages = pages
+        self.next = next_use(pages)
+        self.position = 0
+        self.slots = []
+        self.slot_of = {}
+        self.upcoming = {}
+        self.heap = []
+
+    def access(self, page):
+        """Reference ``page``; returns True on a hit."""
+        i = self.position
+        if self.pages[i] != page:
+            raise ValueError(f"Reference {i + 1} is page {self.pages[i]}, not {page}.")
+        self.position = i + 1
+        nxt = self.next[i]
+
+        slot = self.slot_of.get(page)
+        hit = slot is not None
+        if not hit:
+            if len(self.slots) < self.frames:
+                slot = len(self.slots)
+                self.slots.append(page)
+            else:
+                slot = self.evict()
+                self.slots[slot] = page
+            self.slot_of[page] = slot
+        self.upcoming[page] = nxt
+        heapq.heappush(self.heap, (-nxt, slot, page))
+        if len(self.heap) > 2 * self.frames + 16:
+            self.compact()
+        return hit
+
+    def evict(self):
+        """Drop the resident page used farthest in the future; returns its frame."""
+        heap = self.heap
+        while True:
+            key, slot, page = heapq.heappop(heap)
+            if self.upcoming.get(page) == -key and self.slot_of.get(page) == slot:
+                del self.upcoming[page]
+                del self.slot_of[page]
+                return slot
+
+    def compact(self):
+        self.heap = [(-self.upcoming[page], slot, page) for page, slot in self.slot_of.items()]
+        heapq.heapify(self.heap)
+
+    def snapshot(self):
+        """Resident pages in frame order."""
+        return list(self.slots)
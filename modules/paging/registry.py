@@ -0,0 +1,34 @@
+from .adaptive import ARC, TwoQueue
+from .clock import Clock, EnhancedClock, WSClock
+from .fifo import FIFO
+from .frequency import LFU, MFU
+from .lru import LRU
+from .optimal import Optimal
+
+# Every policy is built from a frame count and exposes access(page) -> hit
+# and snapshot() -> resident pages in display order. Optimal also needs the
+# reference string: make("Optimal", frames, pages=pages). LFU and MFU take
+# an optional aging period, WSClock a working set window ``tau``. The clock
+# family also accepts access(page, write) to track dirty pages. ARC and 2Q
+# expose stats() with hit ratio and ghost-list hits.
+POLICIES = {
+    "LRU": LRU,
+    "FIFO": FIFO,
+    "Optimal": Optimal,
+    "LFU": LFU,
+    "MFU": MFU,
+    "Clock": Clock,
+    "Enhanced Clock": EnhancedClock,
+    "WSClock": WSClock,
+    "ARC": ARC,
+    "2Q": TwoQueue,
+}
+
+
+def make(name, frames, **options):
+    """Build the replacement policy registered under ``name``."""
+    try:
+        policy = POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown page replacement algorithm: {name}") from None
+    return policy(frames, **options)
@@ -0,0 +1,138 @@
+"""Fault counts for every frame count from one pass (Mattson stack distance).
+
+LRU and OPT are stack algorithms: the pages resident with ``c`` frames are
+always a subset of those resident with ``c + 1``. A reference therefore
+hits for exactly the frame counts at or above its stack distance, and a
+histogram of distances gives the whole faults-vs-frames curve.
+"""
+
+from array import array
+
+from .optimal import next_use
+
+# Stacks shallower than this are scanned in Python; deeper ones with NumPy
+_VECTOR_DEPTH = 64
+
+
+class _Fenwick:
+    """Prefix sums over 1..n with O(log n) point updates."""
+
+    def __init__(self, n):
+        self.tree = [0] * (n + 1)
+
+    def add(self, i, delta):
+        tree = self.tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+
+def _curve(histogram, cold, max_frames):
+    """Turn a stack-distance histogram into faults for 1..max_frames frames.
+
+    ``histogram[d]`` counts re-references at distance ``d``; everything
+    deeper than ``max_frames`` is lumped into ``histogram[max_frames + 1]``.
+    """
+    faults = []
+    misses = cold + sum(histogram[2:])
+    for frames in range(1, max_frames + 1):
+        faults.append(misses)
+        misses -= histogram[frames + 1]
+    return faults
+
+
+def lru_fault_curve(pages, max_frames):
+    """LRU page faults for 1..``max_frames`` frames in O(n log n).
+
+    The Fenwick tree marks the latest reference of every page, so the
+    stack distance of a re-reference is the number of marks since the
+    page's previous reference.
+    """
+    if max_frames <= 0:
+        raise ValueError("Number of frames must be greater than 0.")
+    tree = _Fenwick(len(pages))
+    histogram = [0] * (max_frames + 2)
+    last = {}
+    cold = 0
+    for t, page in enumerate(pages, 1):
+        prev = last.get(page)
+        if prev is None:
+            cold += 1
+        else:
+            distance = tree.prefix(t - 1) - tree.prefix(prev) + 1
+            histogram[min(distance, max_frames + 1)] += 1
+            tree.add(prev, -1)
+        tree.add(t, 1)
+        last[page] = t
+    return _curve(histogram, cold, max_frames)
+
+
+def opt_fault_curve(pages, max_frames):
+    """Optimal (Belady) page faults for 1..``max_frames`` frames.
+
+    Uses Mattson's priority stack with next use as the priority: the
+    referenced page goes on top and each displaced page sinks past the
+    ones needed before it. Unlike the LRU curve this is not O(n log n):
+    every page above the referenced one has to be compared, so a reference
+    costs O(min(depth, max_frames)) and the whole curve is
+    O(n * min(distinct pages, max_frames)). A page map replaces the list
+    search, and deep stacks find the pages that sink (running maxima of
+    next use) with one NumPy pass, so only those are moved in Python.
+    """
+    if max_frames <= 0:
+        raise ValueError("Number of frames must be greater than 0.")
+    import numpy as np
+
+    nxt = next_use(pages)
+    stack = [None] * (max_frames + 1)
+    upcoming = array("q", bytes(8 * (max_frames + 1)))  # next use per slot
+    view = np.frombuffer(upcoming, dtype=np.int64)
+    slot = {}
+    seen = set()
+    size = 0
+    histogram = [0] * (max_frames + 2)
+    cold = 0
+    for t, page in enumerate(pages):
+        depth = slot.get(page)
+        if depth is not None:
+            histogram[depth + 1] += 1
+        else:
+            if page in seen:
+                histogram[max_frames + 1] += 1
+            else:
+                cold += 1
+                seen.add(page)
+            depth = size
+            size += 1
+
+        if depth:
+            carry = stack[0]
+            carry_next = upcoming[0]
+            if depth < _VECTOR_DEPTH:
+                sinking = range(1, depth)
+            else:
+                latest = np.maximum.accumulate(view[:depth])
+                sinking = (np.flatnonzero(latest[1:] > latest[:-1]) + 1).tolist()
+            for i in sinking:
+                if upcoming[i] > carry_next:
+                    stack[i], carry = carry, stack[i]
+                    upcoming[i], carry_next = carry_next, upcoming[i]
+                    slot[stack[i]] = i
+            stack[depth] = carry
+            upcoming[depth] = carry_next
+            slot[carry] = depth
+        stack[0] = page
+        upcoming[0] = nxt[t]
+        slot[page] = 0
+        if size > max_frames:
+            size -= 1
+            del slot[stack[size]]
+    return _curve(histogram, cold, max_frames)
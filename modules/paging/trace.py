@@ -0,0 +1,127 @@
+"""Streaming reference strings for traces too large to hold in memory.
+
+Readers yield one page number at a time, or ``(page, is_write)`` pairs with
+``writes=True``; ``replay`` runs a policy over them keeping only counters
+and, optionally, a bounded window of sampled snapshots. Optimal needs the whole trace up front, so it cannot be replayed
+from a one-shot stream: pass it the compact array from ``load_trace``.
+"""
+
+import os
+from array import array
+from collections import deque
+from itertools import starmap
+
+BINARY_SUFFIXES = (".bin", ".i32", ".dat")
+
+
+def read_text(path, chunk_size=1 << 20, writes=False):
+    """Yield pages from a whitespace-separated text file, chunk by chunk.
+
+    Write markers ("3w") are dropped unless ``writes`` is set, in which case
+    ``(page, is_write)`` pairs are yielded instead.
+    """
+    tail = ""
+    with open(path, "r") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            tokens = (tail + chunk).split()
+            # The last token may continue in the next chunk
+            tail = tokens.pop() if tokens and not chunk[-1].isspace() else ""
+            if writes:
+                for token in tokens:
+                    yield int(token.rstrip("wW")), token[-1] in "wW"
+            else:
+                for token in tokens:
+                    yield int(token.rstrip("wW"))
+    if tail:
+        yield (int(tail.rstrip("wW")), tail[-1] in "wW") if writes else int(tail.rstrip("wW"))
+
+
+def load_binary(path, dtype="int32"):
+    """Memory-map a file of native-endian integers as a NumPy array."""
+    import numpy as np
+
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def read_binary(path, dtype="int32", chunk_size=1 << 20, writes=False):
+    """Yield pages from a binary trace, converting one mapped chunk at a time.
+
+    Binary traces carry no write flags, so with ``writes`` every pair is a read.
+    """
+    pages = load_binary(path, dtype)
+    for start in range(0, len(pages), chunk_size):
+        chunk = pages[start:start + chunk_size].tolist()
+        if writes:
+            yield from zip(chunk, [False] * len(chunk))
+        else:
+            yield from chunk
+
+
+def read_trace(path, **options):
+    """``read_binary`` for .bin/.i32/.dat files, ``read_text`` otherwise."""
+    if str(path).lower().endswith(BINARY_SUFFIXES):
+        return read_binary(path, **options)
+    return read_text(path, **options)
+
+
+def load_trace(path):
+    """Read a whole trace into a compact ``array`` (4 or 8 bytes a page)."""
+    if str(path).lower().endswith(BINARY_SUFFIXES):
+        pages = array("i")
+        with open(path, "rb") as f:
+            pages.fromfile(f, os.path.getsize(path) // pages.itemsize)
+        return pages
+    return array("q", read_text(path))
+
+
+def steps(policy, pages, writes=False):
+    """Lazily yield ``(reference number, page, hit)`` for each reference.
+
+    With ``writes``, ``pages`` holds ``(page, is_write)`` pairs.
+    """
+    access = policy.access
+    if writes:
+        for i, (page, write) in enumerate(pages, 1):
+            yield i, page, access(page, write)
+    else:
+        for i, page in enumerate(pages, 1):
+            yield i, page, access(page)
+
+
+def replay(policy, pages, sample_every=0, window=16, writes=False):
+    """Run ``policy`` over a page stream and return summary counters.
+
+    Every ``sample_every`` references (0 = never) the memory is snapshotted
+    into a window that keeps only the last ``window`` samples, each a
+    ``(reference number, page, step_type, memory)`` tuple. With ``writes``,
+    ``pages`` holds ``(page, is_write)`` pairs (see ``read_trace``) that are
+    passed on to ``access``. Policies that track dirty pages also report
+    ``write_backs``.
+    """
+    references = faults = 0
+    samples = deque(maxlen=window)
+    if not sample_every:
+        hits = starmap(policy.access, pages) if writes else map(policy.access, pages)
+        for hit in hits:
+            references += 1
+            if not hit:
+                faults += 1
+    else:
+        for references, page, hit in steps(policy, pages, writes):
+            if not hit:
+                faults += 1
+            if references % sample_every == 0:
+                samples.append((references, page, "Hit" if hit else "Fault", policy.snapshot()))
+    result = {
+        "references": references,
+        "faults": faults,
+        "hits": references - faults,
+        "fault_ratio": faults / references if references else 0.0,
+        "samples": list(samples),
+    }
+    if hasattr(policy, "write_backs"):
+        result["write_backs"] = policy.write_backs
+    return result
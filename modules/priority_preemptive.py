@@ -4,65 +4,22 @@ import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import matplotlib.patches as patches
 
-# Process class
-class Process:
-    def __init__(self, pid, arrival, burst, priority):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.priority = priority
-        self.remaining = burst
-        self.start = None
-        self.completion = 0
-        self.waiting = 0
-        self.turnaround = 0
+from scheduling import Process, TickTimeline
+from scheduling import priority_preemptive as priority_preemptive_engine
+from scheduling.metrics import format_summary, summarize_processes
 
 # Scheduling algorithm
-def priority_preemptive(processes):
-    time = 0
-    completed = 0
-    n = len(processes)
-    timeline = []
-    log = []
-    ready_queue = []
-    current = None
-
-    processes.sort(key=lambda p: p.arrival)
-
-    while completed < n:
-        for p in processes:
-            if p.arrival == time:
-                ready_queue.append(p)
-                log.append(f"Time {time}: Process P{p.pid} (Priority {p.priority}) arrived.")
-
-        ready_queue = [p for p in ready_queue if p.remaining > 0]
-        ready_queue.sort(key=lambda p: (p.priority, p.arrival))
-
-        if ready_queue:
-            if current != ready_queue[0]:
-                current = ready_queue[0]
-                if current.start is None:
-                    current.start = time
-                log.append(f"Time {time}: Switched to P{current.pid} (Priority {current.priority}).")
-            else:
-                log.append(f"Time {time}: Continuing P{current.pid}.")
-
-            current.remaining -= 1
-            timeline.append((time, current.pid, f"Executing P{current.pid} (Priority {current.priority})"))
-
-            if current.remaining == 0:
-                current.completion = time + 1
-                current.turnaround = current.completion - current.arrival
-                current.waiting = current.turnaround - current.burst
-                log.append(f"Time {time+1}: Process P{current.pid} completed.")
-                completed += 1
-                current = None
-        else:
-            timeline.append((time, None, "CPU Idle"))
-
-        time += 1
-
-    return processes, timeline, log
+def priority_preemptive(processes, aging=None):
+    processes, segments, log = priority_preemptive_engine(processes, aging)
+    priorities = {p.pid: p.priority for p in processes}
+
+    def describe(index, time):
+        pid = segments[index].pid
+        if segments[index].kind == "CPU":
+            return (time, pid, f"Executing P{pid} (Priority {priorities[pid]})")
+        return (time, None, "CPU Idle")
+
+    return processes, TickTimeline(segments, describe), log
 
 # Timeline Visualizer
 def visualize_dynamic_timeline(timeline):
@@ -104,7 +61,7 @@ class PriorityGUI:
         input_frame.pack(pady=10)
 
         self.entries = {}
-        fields = ["Number of Processes", "Arrival Times", "Burst Times", "Priorities"]
+        fields = ["Number of Processes", "Arrival Times", "Burst Times", "Priorities", "Aging Interval (0 = off)"]
         for i, label_text in enumerate(fields):
             label = tk.Label(input_frame, text=label_text + ":", font=("Arial", 12), bg="#f2f2f2")
             label.grid(row=i, column=0, sticky='e', padx=5, pady=5)
@@ -128,15 +85,16 @@ class PriorityGUI:
             arrival = list(map(int, self.entries["Arrival Times"].get().split()))
             burst = list(map(int, self.entries["Burst Times"].get().split()))
             priority = list(map(int, self.entries["Priorities"].get().split()))
+            aging = int(self.entries["Aging Interval (0 = off)"].get() or 0)
 
-            if not (len(arrival) == len(burst) == len(priority) == n):
+            if not (len(arrival) == len(burst) == len(priority) == n) or aging < 0:
                 raise ValueError
         except:
             messagebox.showerror("Input Error", "Please check the entered values.")
             return
 
-        processes = [Process(i + 1, arrival[i], burst[i], priority[i]) for i in range(n)]
-        scheduled, timeline, log = priority_preemptive(processes)
+        processes = [Process(i + 1, arrival[i], burst[i], priority=priority[i]) for i in range(n)]
+        scheduled, timeline, log = priority_preemptive(processes, aging=aging or None)
 
         # Table
         cols = ("PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting")
@@ -146,19 +104,13 @@ class PriorityGUI:
             tree.column(col, anchor='center', width=90)
         tree.pack()
 
-        total_tat, total_wt = 0, 0
         for p in scheduled:
-            total_tat += p.turnaround
-            total_wt += p.waiting
             tree.insert('', 'end', values=(p.pid, p.arrival, p.burst, p.priority, p.start,
                                            p.completion, p.turnaround, p.waiting))
 
-        avg_tat = total_tat / n
-        avg_wt = total_wt / n
-
         avg_label = tk.Label(self.result_frame,
-                             text=f"Average Turnaround Time: {avg_tat:.2f}    Average Waiting Time: {avg_wt:.2f}",
-                             font=("Arial", 12, "bold"), bg="#f2f2f2", pady=10)
+                             text=format_summary(summarize_processes(scheduled, timeline.segments)),
+                             font=("Arial", 12, "bold"), bg="#f2f2f2", pady=10, justify='left')
         avg_label.pack()
 
         visualize_dynamic_timeline(timeline)
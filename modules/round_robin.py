@@ -5,75 +5,30 @@ import matplotlib.animation as animation
 from matplotlib.patches import Patch
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-
-class Process:
-    def __init__(self, pid, arrival, burst, io_burst=0):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.io_burst = io_burst
-        self.remaining = burst
-        self.completion = 0
-        self.waiting = 0
-        self.turnaround = 0
-        self.timeline = []
+from scheduling import Process, TickTimeline, round_robin
+from scheduling.metrics import format_summary, summarize_processes
 
 
 def round_robin_with_io(processes, quantum):
-    time = 0
-    queue = []
-    completed = 0
-    n = len(processes)
-    arrival_index = 0
-    processes.sort(key=lambda x: x.arrival)
-
-    timeline = []
-    log = []
-
-    while completed < n:
-        while arrival_index < n and processes[arrival_index].arrival <= time:
-            log.append(f"Time {time}: Process P{processes[arrival_index].pid} arrived and added to queue.")
-            queue.append(processes[arrival_index])
-            arrival_index += 1
-
-        if not queue:
-            timeline.append((time, None, "CPU Idle (No process available)"))
-            time += 1
-            continue
-
-        curr = queue.pop(0)
-        exec_time = min(curr.remaining, quantum)
-        start = time
-        end = time + exec_time
-        curr.timeline.append((start, end))
-        curr.remaining -= exec_time
-
-        for t in range(start, end):
-            explanation = f"At time {start}: P{curr.pid} executes for {exec_time} units (Remaining: {curr.remaining})"
-            timeline.append((t, curr.pid, explanation))
-
-        time = end
-
-        if curr.remaining == 0 and curr.io_burst > 0:
-            for i in range(curr.io_burst):
-                explanation = f"At time {time}: I/O in progress for Process P{curr.pid}"
-                timeline.append((time, None, explanation))
-                time += 1
-
-        while arrival_index < n and processes[arrival_index].arrival <= time:
-            log.append(f"Time {time}: Process P{processes[arrival_index].pid} arrived and added to queue.")
-            queue.append(processes[arrival_index])
-            arrival_index += 1
-
-        if curr.remaining > 0:
-            queue.append(curr)
-        else:
-            curr.completion = time
-            curr.turnaround = curr.completion - curr.arrival
-            curr.waiting = curr.turnaround - (curr.burst + curr.io_burst)
-            completed += 1
+    processes, segments, log = round_robin(processes, quantum)
+
+    # Remaining burst after each CPU slice, for the per-tick explanations
+    left = {p.pid: p.burst for p in processes}
+    remaining = []
+    for segment in segments:
+        if segment.kind == "CPU":
+            left[segment.pid] -= segment.end - segment.start
+        remaining.append(left.get(segment.pid))
+
+    def describe(index, time):
+        start, end, pid, kind, _ = segments[index]
+        if kind == "CPU":
+            return (time, pid, f"At time {start}: P{pid} executes for {end - start} units (Remaining: {remaining[index]})")
+        if kind == "IO":
+            return (time, None, f"At time {time}: I/O in progress for Process P{pid}")
+        return (time, None, "CPU Idle (No process available)")
 
-    return processes, timeline, log
+    return processes, TickTimeline(segments, describe), log
 
 
 def manual_gantt_stepper(timeline, processes):
@@ -271,18 +226,12 @@ def main():
             for col, header in enumerate(headers):
                 tk.Label(table_frame, text=header, font=('Arial', 11, 'bold')).grid(row=0, column=col)
 
-            total_tat = 0
-            total_wt = 0
             for i, p in enumerate(scheduled):
                 values = [p.pid, p.arrival, p.burst, p.io_burst, p.completion, p.turnaround, p.waiting]
                 for j, val in enumerate(values):
                     tk.Label(table_frame, text=val, font=('Arial', 10)).grid(row=i + 1, column=j)
-                total_tat += p.turnaround
-                total_wt += p.waiting
 
-            avg_tat = total_tat / num_processes
-            avg_wt = total_wt / num_processes
-            label_avg.config(text=f"Average Turnaround Time: {avg_tat:.2f} | Average Waiting Time: {avg_wt:.2f}")
+            label_avg.config(text=format_summary(summarize_processes(scheduled, timeline.segments)))
 
             visualize_timeline(timeline, scheduled, chart_mode)
 
@@ -0,0 +1,19 @@
+"""Headless CPU scheduling engines shared by the tkinter front ends.
+
+Nothing in this package imports tkinter or matplotlib, so batch runs can use
+it directly::
+
+    from scheduling import Process, run
+    processes, segments, log = run("RR", [Process(1, 0, 5), Process(2, 1, 3)], quantum=2)
+"""
+
+from .fcfs import fcfs
+from .mlfq import mlfq
+from .multilevel import POLICIES, multilevel_queue
+from .priority import priority_non_preemptive, priority_preemptive
+from .process import Process
+from .registry import ENGINES, run
+from .round_robin import round_robin
+from .segments import Segment, TickTimeline
+from .sjf import sjf, srtf
+from .table import ProcessTable
@@ -0,0 +1,28 @@
+from .segments import Segment
+
+
+def fcfs(processes):
+    """First Come First Serve, jumping the clock from arrival to completion."""
+    processes.sort(key=lambda p: (p.arrival, p.pid))
+    for p in processes:
+        p.reset()
+    time = 0
+    segments = []
+
+    for p in processes:
+        if time < p.arrival:
+            segments.append(Segment(time, p.arrival, None, "IDLE"))
+            time = p.arrival
+
+        p.start = time
+        if p.burst > 0:
+            segments.append(Segment(time, time + p.burst, p.pid, "CPU"))
+            time += p.burst
+
+        if p.io_burst > 0:
+            segments.append(Segment(time, time + p.io_burst, p.pid, "IO"))
+            time += p.io_burst
+
+        p.complete(time)
+
+    return processes, segments, []
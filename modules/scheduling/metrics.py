@@ -0,0 +1,96 @@
+"""Vectorized summary statistics for a finished schedule.
+
+Everything here works on whole columns at once, so a million-job trace is
+summarized in milliseconds. Import it as ``scheduling.metrics``; it is kept
+out of the package namespace because it needs NumPy.
+"""
+
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+
+
+def columns(processes):
+    """Pull the metric inputs out of Process objects as int64 arrays."""
+    n = len(processes)
+
+    def column(name):
+        return np.fromiter((getattr(p, name) for p in processes), dtype=np.int64, count=n)
+
+    return {name: column(name) for name in ("arrival", "burst", "io_burst", "start", "completion")}
+
+
+def context_switches(segments):
+    """Count dispatches that hand the CPU to a different process.
+
+    Idle gaps do not count, and neither does a process resuming after an
+    idle gap or moving to another queue level.
+    """
+    pids = np.fromiter((s.pid for s in segments if s.kind == "CPU"), dtype=np.int64)
+    return int(np.count_nonzero(pids[1:] != pids[:-1]))
+
+
+def summarize(arrival, burst, completion, start=None, io_burst=None, segments=None):
+    """Turnaround, waiting and response statistics plus CPU utilization.
+
+    ``arrival``, ``burst``, ``completion`` and the optional ``start`` and
+    ``io_burst`` are equal-length sequences (lists or arrays). ``segments``
+    is the engine's segment list; without it the context-switch count is
+    None and the CPU is assumed busy for the total burst time.
+    """
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+    completion = np.asarray(completion, dtype=np.int64)
+    if not len(arrival):
+        raise ValueError("No processes to summarize.")
+
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    if io_burst is not None:
+        waiting -= np.asarray(io_burst, dtype=np.int64)
+
+    stats = {"count": len(arrival)}
+    for name, values in (("turnaround", turnaround), ("waiting", waiting)):
+        stats[name] = _describe(values)
+    if start is not None:
+        stats["response"] = _describe(np.asarray(start, dtype=np.int64) - arrival)
+
+    span = int(completion.max() - arrival.min())
+    if segments is not None:
+        busy = int(np.fromiter((s.end - s.start for s in segments if s.kind == "CPU"), dtype=np.int64).sum())
+        stats["context_switches"] = context_switches(segments)
+    else:
+        busy = int(burst.sum())
+        stats["context_switches"] = None
+    stats["makespan"] = span
+    stats["cpu_utilization"] = busy / span if span else 0.0
+    stats["throughput"] = len(arrival) / span if span else 0.0
+    return stats
+
+
+def summarize_processes(processes, segments=None):
+    """``summarize`` for a list of scheduled Process objects."""
+    cols = columns(processes)
+    return summarize(cols["arrival"], cols["burst"], cols["completion"], cols["start"], cols["io_burst"], segments)
+
+
+def format_summary(stats):
+    """Multi-line text report of ``summarize`` output for the GUIs."""
+    lines = []
+    for name in ("turnaround", "waiting", "response"):
+        if name in stats:
+            s = stats[name]
+            tails = "  ".join(f"p{q}: {s[f'p{q}']:.2f}" for q in PERCENTILES)
+            lines.append(f"{name.capitalize():10} avg: {s['mean']:.2f}  {tails}  max: {s['max']}")
+    lines.append(f"CPU Utilization: {stats['cpu_utilization'] * 100:.1f}%  |  "
+                 f"Throughput: {stats['throughput']:.3f} jobs/unit")
+    if stats["context_switches"] is not None:
+        lines[-1] += f"  |  Context Switches: {stats['context_switches']}"
+    return "\n".join(lines)
+
+
+def _describe(values):
+    summary = {"mean": float(values.mean()), "max": int(values.max())}
+    for q, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{q}"] = float(v)
+    return summary
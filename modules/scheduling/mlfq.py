@@ -0,0 +1,83 @@
+import heapq
+from collections import deque
+
+from .segments import Segment
+
+
+def mlfq(processes, config):
+    """Multilevel feedback queue.
+
+    ``config`` holds one ``{"type": ..., "quantum": ...}`` dict per level,
+    ``type`` being ``"RR"``, ``"SJF"`` or ``"FCFS"``. New processes enter
+    level 0 and a process that uses up its RR quantum drops one level. RR
+    and FCFS levels are deques served in insertion order and SJF levels are
+    heaps keyed by (remaining, arrival, pid), so no level is re-sorted on
+    dispatch. Arrival and demotion messages go to the log.
+    """
+    processes.sort(key=lambda p: (p.arrival, p.pid))
+    for p in processes:
+        p.reset()
+    time = 0
+    arrival_index = 0
+    segments = []
+    log = []
+    queues = [[] if level_cfg["type"] == "SJF" else deque() for level_cfg in config]
+    n = len(processes)
+    waiting = 0
+
+    def enqueue(level, idx):
+        # Queues hold indices into processes, which also break heap ties
+        nonlocal waiting
+        if config[level]["type"] == "SJF":
+            p = processes[idx]
+            heapq.heappush(queues[level], (p.remaining, p.arrival, p.pid, idx))
+        else:
+            queues[level].append(idx)
+        waiting += 1
+
+    def admit_arrivals():
+        nonlocal arrival_index
+        while arrival_index < n and processes[arrival_index].arrival <= time:
+            enqueue(0, arrival_index)
+            log.append(f"Time {time}: Process P{processes[arrival_index].pid} arrived and added to Queue 0.")
+            arrival_index += 1
+
+    while arrival_index < n or waiting:
+        admit_arrivals()
+
+        if not waiting:
+            next_time = processes[arrival_index].arrival
+            segments.append(Segment(time, next_time, None, "IDLE"))
+            time = next_time
+            continue
+
+        level = next(lvl for lvl, queue in enumerate(queues) if queue)
+        sched_type = config[level]["type"]
+        if sched_type == "SJF":
+            idx = heapq.heappop(queues[level])[3]
+        else:
+            idx = queues[level].popleft()
+        curr = processes[idx]
+        waiting -= 1
+
+        exec_time = min(curr.remaining, config[level]["quantum"]) if sched_type == "RR" else curr.remaining
+
+        if curr.start is None:
+            curr.start = time
+        if exec_time > 0:
+            segments.append(Segment(time, time + exec_time, curr.pid, "CPU", level))
+        time += exec_time
+        curr.remaining -= exec_time
+
+        admit_arrivals()
+
+        if curr.remaining == 0:
+            curr.complete(time)
+        elif level + 1 < len(queues):
+            curr.queue_level = level + 1
+            enqueue(level + 1, idx)
+            log.append(f"Time {time}: P{curr.pid} demoted to Queue {level + 1}.")
+        else:
+            enqueue(level, idx)
+
+    return processes, segments, log
@@ -0,0 +1,117 @@
+import heapq
+from collections import deque
+
+from .segments import Segment
+
+POLICIES = ("FCFS", "RR", "SJF", "PRIORITY")
+
+
+def multilevel_queue(processes, levels, arbitration="priority", slices=None):
+    """Multilevel queue over any number of levels.
+
+    ``levels`` is a list of ``{"type": ..., "quantum": ...}`` dicts, one per
+    queue, where ``type`` is one of ``POLICIES``. Each process runs in the
+    level given by its ``queue``. With ``arbitration="priority"`` the
+    lowest-numbered non-empty queue always goes first. With ``"timeslice"``
+    the queues take turns, each getting ``slices[level]`` time units per
+    turn. A FCFS, SJF or PRIORITY job cut off by the end of its queue's turn
+    resumes first on the next turn; an RR job goes to the back of its queue,
+    as it would at the end of a quantum.
+    """
+    if arbitration not in ("priority", "timeslice"):
+        raise ValueError(f"Unknown arbitration: {arbitration}")
+    if arbitration == "timeslice" and (slices is None or len(slices) != len(levels)):
+        raise ValueError("Time-slice arbitration needs one slice per queue.")
+    if arbitration == "timeslice" and any(s <= 0 for s in slices):
+        raise ValueError("Time slices must be positive.")
+    for p in processes:
+        if not 0 <= p.queue < len(levels):
+            raise ValueError(f"P{p.pid} is assigned to queue {p.queue}, but only {len(levels)} queues exist.")
+
+    processes.sort(key=lambda p: (p.arrival, p.pid))
+    for p in processes:
+        p.reset()
+    n = len(processes)
+    num_levels = len(levels)
+    queues = [[] if level["type"] in ("SJF", "PRIORITY") else deque() for level in levels]
+    resume = [None] * num_levels  # job cut off by the end of its queue's time slice
+    time = 0
+    i = 0
+    waiting = 0
+    segments = []
+    log = []
+    active = num_levels - 1
+    budget = 0
+
+    def enqueue(idx):
+        # Queues hold indices into processes, which also break heap ties
+        nonlocal waiting
+        p = processes[idx]
+        level_type = levels[p.queue]["type"]
+        if level_type == "SJF":
+            heapq.heappush(queues[p.queue], (p.burst, p.arrival, p.pid, idx))
+        elif level_type == "PRIORITY":
+            heapq.heappush(queues[p.queue], (p.priority, p.arrival, p.pid, idx))
+        else:
+            queues[p.queue].append(idx)
+        waiting += 1
+
+    def admit_arrivals():
+        nonlocal i
+        while i < n and processes[i].arrival <= time:
+            log.append(f"Time {time}: Process P{processes[i].pid} arrived (Queue: {processes[i].queue})")
+            enqueue(i)
+            i += 1
+
+    def has_work(level):
+        return resume[level] is not None or queues[level]
+
+    while i < n or waiting:
+        admit_arrivals()
+
+        if not waiting:
+            segments.append(Segment(time, processes[i].arrival, None, "IDLE"))
+            time = processes[i].arrival
+            continue
+
+        if arbitration == "priority":
+            level = next(lvl for lvl in range(num_levels) if has_work(lvl))
+            budget = float("inf")
+        else:
+            if budget <= 0 or not has_work(active):
+                active = next(lvl % num_levels for lvl in range(active + 1, active + 1 + num_levels)
+                              if has_work(lvl % num_levels))
+                budget = slices[active]
+            level = active
+
+        if resume[level] is not None:
+            idx, resume[level] = resume[level], None
+        elif levels[level]["type"] in ("SJF", "PRIORITY"):
+            idx = heapq.heappop(queues[level])[3]
+        else:
+            idx = queues[level].popleft()
+        curr = processes[idx]
+        waiting -= 1
+
+        exec_time = curr.remaining
+        if levels[level]["type"] == "RR":
+            exec_time = min(exec_time, levels[level]["quantum"])
+        exec_time = min(exec_time, budget)
+
+        if curr.start is None:
+            curr.start = time
+        if exec_time > 0:
+            segments.append(Segment(time, time + exec_time, curr.pid, "CPU", level))
+        time += exec_time
+        budget -= exec_time
+        curr.remaining -= exec_time
+
+        if curr.remaining == 0:
+            curr.complete(time)
+        elif levels[level]["type"] == "RR":
+            enqueue(idx)
+        else:
+            resume[level] = idx
+            waiting += 1
+
+    return processes, segments, log
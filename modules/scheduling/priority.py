@@ -0,0 +1,115 @@
+import heapq
+
+from .segments import Segment, extend
+
+
+def priority_non_preemptive(processes):
+    """Non-preemptive priority scheduling with a heap keyed by (priority, arrival, pid).
+
+    Lower numbers mean higher priority. I/O follows the CPU burst.
+    """
+    time = 0
+    n = len(processes)
+    next_arrival = 0
+    ready_queue = []
+    segments = []
+
+    processes.sort(key=lambda p: (p.arrival, p.pid))
+    for p in processes:
+        p.reset()
+
+    while next_arrival < n or ready_queue:
+        if not ready_queue and time < processes[next_arrival].arrival:
+            # CPU idle: jump straight to the next arrival
+            segments.append(Segment(time, processes[next_arrival].arrival, None, "IDLE"))
+            time = processes[next_arrival].arrival
+
+        while next_arrival < n and processes[next_arrival].arrival <= time:
+            p = processes[next_arrival]
+            heapq.heappush(ready_queue, (p.priority, p.arrival, p.pid, next_arrival))
+            next_arrival += 1
+
+        current = processes[heapq.heappop(ready_queue)[3]]
+        current.start = time
+        if current.burst > 0:
+            segments.append(Segment(time, time + current.burst, current.pid, "CPU"))
+            time += current.burst
+
+        if current.io_burst > 0:
+            segments.append(Segment(time, time + current.io_burst, current.pid, "IO"))
+            time += current.io_burst
+
+        current.complete(time)
+
+    return processes, segments, []
+
+
+def priority_preemptive(processes, aging=None):
+    """Preemptive priority scheduling driven by arrival and completion events.
+
+    Lower numbers mean higher priority. With ``aging`` set, a waiting process
+    gains one priority level for every ``aging`` time units it spends in the
+    ready queue, which keeps low-priority work from starving.
+    """
+    processes.sort(key=lambda p: (p.arrival, p.pid))
+    for p in processes:
+        p.reset()
+    n = len(processes)
+    time = 0
+    next_arrival = 0
+    segments = []
+    log = []
+    ready_queue = []  # heap of (key, arrival, pid, index)
+    current = None
+    current_priority = None
+
+    def key(p, since):
+        # With aging the effective priority at time t is ceil((key - t) / aging),
+        # so ordering on the key alone stays valid as time passes.
+        return p.priority if aging is None else p.priority * aging + since
+
+    def effective(entry_key):
+        return entry_key if aging is None else -((time - entry_key) // aging)
+
+    while next_arrival < n or ready_queue or current is not None:
+        if current is None and not ready_queue and time < processes[next_arrival].arrival:
+            segments.append(Segment(time, processes[next_arrival].arrival, None, "IDLE"))
+            time = processes[next_arrival].arrival
+
+        while next_arrival < n and processes[next_arrival].arrival <= time:
+            p = processes[next_arrival]
+            heapq.heappush(ready_queue, (key(p, time), p.arrival, p.pid, next_arrival))
+            log.append(f"Time {time}: Process P{p.pid} (Priority {p.priority}) arrived.")
+            next_arrival += 1
+
+        if current is not None and ready_queue and effective(ready_queue[0][0]) < current_priority:
+            p = processes[current]
+            heapq.heappush(ready_queue, (key(p, time), p.arrival, p.pid, current))
+            current = None
+
+        if current is None:
+            entry_key, _, _, current = heapq.heappop(ready_queue)
+            current_priority = effective(entry_key)
+            p = processes[current]
+            if p.start is None:
+                p.start = time
+            log.append(f"Time {time}: Switched to P{p.pid} (Priority {current_priority}).")
+
+        p = processes[current]
+        end = time + p.remaining
+        if next_arrival < n:
+            end = min(end, processes[next_arrival].arrival)
+        if aging is not None and ready_queue:
+            # First instant at which the best waiting process out-ages the running one
+            end = min(end, ready_queue[0][0] - (current_priority - 1) * aging)
+
+        extend(segments, time, end, p.pid, "CPU")
+        p.remaining -= end - time
+        time = end
+
+        if p.remaining == 0:
+            p.complete(time)
+            log.append(f"Time {time}: Process P{p.pid} completed.")
+            current = None
+
+    return processes, segments, log
@@ -0,0 +1,34 @@
+class Process:
+    """A job as seen by every CPU scheduling engine.
+
+    Lower ``priority`` numbers mean higher priority. ``queue`` is the level a
+    process is assigned to by the multilevel queue; ``queue_level`` is the
+    level it finished in under the multilevel feedback queue.
+    """
+
+    # No per-instance __dict__: a million processes fit in a fraction of the memory.
+    __slots__ = ("pid", "arrival", "burst", "io_burst", "priority", "queue", "remaining",
+                 "queue_level", "start", "completion", "turnaround", "waiting")
+
+    def __init__(self, pid, arrival, burst, io_burst=0, priority=0, queue=0):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.io_burst = io_burst
+        self.priority = priority
+        self.queue = queue
+        self.reset()
+
+    def reset(self):
+        """Clear the results of a previous run so the process can be scheduled again."""
+        self.remaining = self.burst
+        self.queue_level = 0
+        self.start = None
+        self.completion = None
+        self.turnaround = None
+        self.waiting = None
+
+    def complete(self, time):
+        self.completion = time
+        self.turnaround = self.completion - self.arrival
+        self.waiting = self.turnaround - (self.burst + self.io_burst)
@@ -0,0 +1,28 @@
+from .fcfs import fcfs
+from .mlfq import mlfq
+from .multilevel import multilevel_queue
+from .priority import priority_non_preemptive, priority_preemptive
+from .round_robin import round_robin
+from .sjf import sjf, srtf
+
+# Every engine takes a list of Process objects plus its own keyword options
+# and returns (processes, segments, log).
+ENGINES = {
+    "FCFS": fcfs,
+    "SJF": sjf,
+    "SRTF": srtf,
+    "RR": round_robin,
+    "PRIORITY": priority_non_preemptive,
+    "PRIORITY_PREEMPTIVE": priority_preemptive,
+    "MLQ": multilevel_queue,
+    "MLFQ": mlfq,
+}
+
+
+def run(algorithm, processes, **options):
+    """Run the engine registered under ``algorithm`` on ``processes``."""
+    try:
+        engine = ENGINES[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}") from None
+    return engine(processes, **options)
@@ -0,0 +1,60 @@
+from collections import deque
+
+from .segments import Segment
+
+
+def round_robin(processes, quantum):
+    """Round Robin over a deque, one segment per quantum slice.
+
+    Idle periods are skipped in a single step, so the cost follows the number
+    of context switches rather than the elapsed time. I/O follows the final
+    CPU slice of a process.
+    """
+    time = 0
+    queue = deque()
+    n = len(processes)
+    arrival_index = 0
+    processes.sort(key=lambda x: (x.arrival, x.pid))
+    for p in processes:
+        p.reset()
+
+    segments = []
+    log = []
+
+    def admit_arrivals():
+        nonlocal arrival_index
+        while arrival_index < n and processes[arrival_index].arrival <= time:
+            log.append(f"Time {time}: Process P{processes[arrival_index].pid} arrived and added to queue.")
+            queue.append(processes[arrival_index])
+            arrival_index += 1
+
+    while arrival_index < n or queue:
+        admit_arrivals()
+
+        if not queue:
+            next_time = processes[arrival_index].arrival
+            segments.append(Segment(time, next_time, None, "IDLE"))
+            time = next_time
+            continue
+
+        curr = queue.popleft()
+        if curr.start is None:
+            curr.start = time
+        exec_time = min(curr.remaining, quantum)
+        curr.remaining -= exec_time
+        if exec_time > 0:
+            segments.append(Segment(time, time + exec_time, curr.pid, "CPU"))
+        time += exec_time
+
+        if curr.remaining == 0 and curr.io_burst > 0:
+            segments.append(Segment(time, time + curr.io_burst, curr.pid, "IO"))
+            time += curr.io_burst
+
+        admit_arrivals()
+
+        if curr.remaining > 0:
+            queue.append(curr)
+        else:
+            curr.complete(time)
+
+    return processes, segments, log
@@ -0,0 +1,48 @@
+from bisect import bisect_right
+from collections import namedtuple
+
+# One contiguous stretch of the schedule. ``kind`` is "CPU", "IO" or "IDLE"
+# (``pid`` is None for idle time); ``level`` is the queue a multilevel
+# scheduler ran the process from.
+Segment = namedtuple("Segment", ["start", "end", "pid", "kind", "level"], defaults=[None])
+
+
+def extend(segments, start, end, pid, kind, level=None):
+    """Append a segment, merging it into the previous one when it continues it."""
+    if end <= start:
+        return
+    if segments:
+        last = segments[-1]
+        if last.end == start and last.pid == pid and last.kind == kind and last.level == level:
+            segments[-1] = last._replace(end=end)
+            return
+    segments.append(Segment(start, end, pid, kind, level))
+
+
+class TickTimeline:
+    """Per-tick view over a segment list that starts at time 0.
+
+    ``describe(index, time)`` turns the segment at ``index`` into the tick
+    tuple for ``time``. Ticks are built on demand with a binary search, so
+    the view can be indexed like a list without storing one tuple per tick.
+    """
+
+    def __init__(self, segments, describe):
+        self.segments = segments
+        self.starts = [segment.start for segment in segments]
+        self.describe = describe
+
+    def __len__(self):
+        return self.segments[-1].end if self.segments else 0
+
+    def __getitem__(self, time):
+        if time < 0:
+            time += len(self)
+        if not 0 <= time < len(self):
+            raise IndexError("timeline index out of range")
+        return self.describe(bisect_right(self.starts, time) - 1, time)
+
+    def __iter__(self):
+        for index, segment in enumerate(self.segments):
+            for time in range(segment.start, segment.end):
+                yield self.describe(index, time)
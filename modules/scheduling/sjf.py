@@ -0,0 +1,90 @@
+import heapq
+
+from .segments import Segment, extend
+
+
+def sjf(processes):
+    """Non-preemptive Shortest Job First with a heap keyed by (burst, arrival, pid)."""
+    processes.sort(key=lambda p: (p.arrival, p.pid))
+    for p in processes:
+        p.reset()
+    time = 0
+    n = len(processes)
+    next_arrival = 0
+    ready_queue = []
+    segments = []
+
+    while next_arrival < n or ready_queue:
+        if not ready_queue and time < processes[next_arrival].arrival:
+            # Nothing to run: jump straight to the next arrival
+            segments.append(Segment(time, processes[next_arrival].arrival, None, "IDLE"))
+            time = processes[next_arrival].arrival
+
+        while next_arrival < n and processes[next_arrival].arrival <= time:
+            p = processes[next_arrival]
+            heapq.heappush(ready_queue, (p.burst, p.arrival, p.pid, next_arrival))
+            next_arrival += 1
+
+        current = processes[heapq.heappop(ready_queue)[3]]
+        current.start = time
+        if current.burst > 0:
+            segments.append(Segment(time, time + current.burst, current.pid, "CPU"))
+            time += current.burst
+
+        if current.io_burst > 0:
+            segments.append(Segment(time, time + current.io_burst, current.pid, "IO"))
+            time += current.io_burst
+
+        current.complete(time)
+
+    return processes, segments, []
+
+
+def srtf(processes):
+    """Shortest Remaining Time First, reacting only to arrivals and completions.
+
+    Ready processes sit in a min-heap keyed by (remaining, arrival, pid). The
+    running process keeps the CPU until it finishes or the next arrival, the
+    only point at which it can be preempted. I/O follows the final CPU burst.
+    """
+    n = len(processes)
+    order = sorted(range(n), key=lambda i: (processes[i].arrival, processes[i].pid))
+    for p in processes:
+        p.reset()
+    ready_queue = []
+    segments = []
+    time = 0
+    next_arrival = 0
+
+    while next_arrival < n or ready_queue:
+        if not ready_queue and time < processes[order[next_arrival]].arrival:
+            segments.append(Segment(time, processes[order[next_arrival]].arrival, None, "IDLE"))
+            time = processes[order[next_arrival]].arrival
+
+        while next_arrival < n and processes[order[next_arrival]].arrival <= time:
+            idx = order[next_arrival]
+            p = processes[idx]
+            heapq.heappush(ready_queue, (p.remaining, p.arrival, p.pid, idx))
+            next_arrival += 1
+
+        idx = heapq.heappop(ready_queue)[3]
+        current = processes[idx]
+        if current.start is None:
+            current.start = time
+
+        horizon = processes[order[next_arrival]].arrival if next_arrival < n else time + current.remaining
+        run = min(current.remaining, horizon - time)
+        extend(segments, time, time + run, current.pid, "CPU")
+        time += run
+        current.remaining -= run
+
+        if current.remaining > 0:
+            heapq.heappush(ready_queue, (current.remaining, current.arrival, current.pid, idx))
+            continue
+
+        if current.io_burst > 0:
+            segments.append(Segment(time, time + current.io_burst, current.pid, "IO"))
+            time += current.io_burst
+        current.complete(time)
+
+    return processes, segments, []
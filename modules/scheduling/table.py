@@ -0,0 +1,93 @@
+from array import array
+
+from .process import Process
+from .registry import run
+
+COLUMNS = ("arrival", "burst", "io_burst", "priority", "start", "completion", "turnaround", "waiting")
+
+# Stored in place of None for results that are not known yet
+UNSET = -1
+
+
+class ProcessTable:
+    """Column-per-field store for very large process traces.
+
+    Every column is an ``array('q')``, so a process costs 8 bytes per field
+    instead of a full Python object. Row ``i`` holds the process with pid
+    ``i + 1``, matching how the GUIs number their processes. ``numpy()``
+    exposes the columns as zero-copy NumPy arrays for vectorized metrics.
+    """
+
+    def __init__(self, arrival, burst, io_burst=None, priority=None):
+        n = len(arrival)
+        if len(burst) != n:
+            raise ValueError("Mismatch in arrival or burst time entries.")
+        self.arrival = array("q", arrival)
+        self.burst = array("q", burst)
+        self.io_burst = array("q", io_burst) if io_burst is not None else array("q", bytes(8 * n))
+        self.priority = array("q", priority) if priority is not None else array("q", bytes(8 * n))
+        if len(self.io_burst) != n or len(self.priority) != n:
+            raise ValueError("Mismatch in I/O burst or priority entries.")
+        self.start = array("q", [UNSET]) * n
+        self.completion = array("q", [UNSET]) * n
+        self.turnaround = array("q", [UNSET]) * n
+        self.waiting = array("q", [UNSET]) * n
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Build a table from Process objects numbered 1..n."""
+        rows = sorted(processes, key=lambda p: p.pid)
+        if any(p.pid != i + 1 for i, p in enumerate(rows)):
+            raise ValueError("Process ids must be 1..n to be stored in a table.")
+        table = cls([p.arrival for p in rows], [p.burst for p in rows],
+                    [p.io_burst for p in rows], [p.priority for p in rows])
+        table.record(rows)
+        return table
+
+    def __len__(self):
+        return len(self.arrival)
+
+    def to_processes(self):
+        return [Process(i + 1, self.arrival[i], self.burst[i], self.io_burst[i], self.priority[i])
+                for i in range(len(self))]
+
+    def record(self, processes):
+        """Copy start and completion times from scheduled Process objects."""
+        for p in processes:
+            row = p.pid - 1
+            if p.start is not None:
+                self.start[row] = p.start
+            if p.completion is not None:
+                self.completion[row] = p.completion
+
+    def schedule(self, algorithm, **options):
+        """Run a registered engine and keep only its results in the table.
+
+        The Process objects the engine needs live only for the duration of
+        the run. Returns ``(segments, log)``.
+        """
+        processes, segments, log = run(algorithm, self.to_processes(), **options)
+        self.record(processes)
+        del processes
+        self.finalize()
+        return segments, log
+
+    def finalize(self):
+        """Fill the turnaround and waiting columns from completion times."""
+        cols = self.numpy()
+        cols["turnaround"][:] = cols["completion"] - cols["arrival"]
+        cols["waiting"][:] = cols["turnaround"] - cols["burst"] - cols["io_burst"]
+
+    def summary(self, segments=None):
+        """``scheduling.metrics.summarize`` over the table's columns."""
+        from .metrics import summarize
+
+        cols = self.numpy()
+        return summarize(cols["arrival"], cols["burst"], cols["completion"],
+                         cols["start"], cols["io_burst"], segments)
+
+    def numpy(self):
+        """Zero-copy ``{column: numpy.ndarray}`` views over the table."""
+        import numpy as np
+
+        return {name: np.frombuffer(getattr(self, name), dtype=np.int64) for name in COLUMNS}
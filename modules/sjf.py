@@ -3,61 +3,19 @@ from tkinter import messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-class Process:
-    def __init__(self, pid, arrival, burst, io_burst=0):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.io_burst = io_burst
-        self.start = None
-        self.completion = None
-        self.turnaround = None
-        self.waiting = None
+from scheduling import Process, sjf
+from scheduling.metrics import format_summary, summarize_processes
 
-def sjf_non_preemptive(processes):
-    processes.sort(key=lambda p: p.arrival)
-    time = 0
-    completed = 0
-    n = len(processes)
-    ready_queue = []
-    timeline = []
-    visited = set()
-
-    while completed < n:
-        for p in processes:
-            if p.arrival <= time and p not in visited and p not in ready_queue:
-                ready_queue.append(p)
-
-        if ready_queue:
-            ready_queue.sort(key=lambda p: p.burst)
-            current = ready_queue.pop(0)
-            visited.add(current)
-
-            if time < current.arrival:
-                for idle in range(time, current.arrival):
-                    timeline.append((idle, idle + 1, None))
-                time = current.arrival
-
-            current.start = time
-            for _ in range(current.burst):
-                timeline.append((time, time + 1, f"P{current.pid}"))
-                time += 1
-
-            if current.io_burst > 0:
-                for _ in range(current.io_burst):
-                    timeline.append((time, time + 1, f"IO-P{current.pid}"))
-                    time += 1
-
-            current.completion = time
-            current.turnaround = current.completion - current.arrival
-            current.waiting = current.turnaround - (current.burst + current.io_burst)
-
-            completed += 1
-        else:
-            timeline.append((time, time + 1, None))
-            time += 1
+def gantt_label(segment):
+    if segment.kind == "IDLE":
+        return None
+    if segment.kind == "IO":
+        return f"IO-P{segment.pid}"
+    return f"P{segment.pid}"
 
-    return processes, timeline
+def sjf_non_preemptive(processes):
+    processes, segments, _ = sjf(processes)
+    return processes, [(segment.start, segment.end, gantt_label(segment)) for segment in segments]
 
 
 def visualize_timeline(timeline, processes, canvas_frame, dynamic=False, manual=False, app_ref=None):
@@ -237,14 +195,10 @@ class SJFApp:
             final_processes, timeline = sjf_non_preemptive(processes)
             result = "PID | Arrival | Burst | I/O | Start | Completion | Turnaround | Waiting\n"
             result += "-" * 75 + "\n"
-            total_tat = total_wt = 0
             for p in final_processes:
-                total_tat += p.turnaround
-                total_wt += p.waiting
                 result += f"{p.pid:3} | {p.arrival:7} | {p.burst:5} | {p.io_burst:3} | {p.start:5} | {p.completion:10} | {p.turnaround:10} | {p.waiting:7}\n"
 
-            result += f"\nAverage Turnaround Time: {total_tat / self.num:.2f}"
-            result += f"\nAverage Waiting Time   : {total_wt / self.num:.2f}"
+            result += "\n" + format_summary(summarize_processes(final_processes))
 
             self.output_label.config(text=result)
 
@@ -3,78 +3,19 @@ from tkinter import messagebox
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-class Process:
-    def __init__(self, pid, arrival, burst, io_burst=0):
-        self.pid = pid
-        self.arrival = arrival
-        self.burst = burst
-        self.io_burst = io_burst
-        self.start = None
-        self.completion = None
-        self.turnaround = None
-        self.waiting = None
+from scheduling import Process, srtf
+from scheduling.metrics import format_summary, summarize_processes
 
-def sjf_preemptive(processes):
-    time = 0
-    n = len(processes)
-    remaining = [p.burst for p in processes]
-    complete = 0
-    timeline = []
-    last_pid = -1
-    is_io_pending = [False] * n
-    io_remaining = [p.io_burst for p in processes]
-    start_times = [None] * n
-    completion_times = [0] * n
-    io_scheduled = [False] * n
-    visited = set()
-
-    while complete < n:
-        # Build the ready queue of non-completed and non-IO processes
-        ready_queue = [i for i in range(n) if processes[i].arrival <= time and remaining[i] > 0 and not is_io_pending[i]]
-        
-        if ready_queue:
-            # Choose process with shortest remaining burst
-            idx = min(ready_queue, key=lambda i: remaining[i])
-            current = processes[idx]
-
-            if start_times[idx] is None:
-                start_times[idx] = time
-
-            # Only log a new time unit if PID changed (new bar)
-            if last_pid != current.pid:
-                timeline.append((time, time + 1, f"P{current.pid}"))
-            else:
-                # Extend the last entry
-                last = timeline.pop()
-                timeline.append((last[0], time + 1, last[2]))
-
-            remaining[idx] -= 1
-            last_pid = current.pid
-
-            if remaining[idx] == 0:
-                if current.io_burst > 0:
-                    is_io_pending[idx] = True
-                    io_start = time + 1
-                    for io_t in range(current.io_burst):
-                        timeline.append((io_start + io_t, io_start + io_t + 1, f"IO-P{current.pid}"))
-                    time += current.io_burst  # advance time due to IO
-                    is_io_pending[idx] = False
-                current.completion = time + 1
-                current.turnaround = current.completion - current.arrival
-                current.waiting = current.turnaround - current.burst - current.io_burst
-                current.start = start_times[idx]
-                completion_times[idx] = current.completion
-                complete += 1
-                visited.add(current.pid)
-            time += 1
-        else:
-            # IDLE time
-            timeline.append((time, time + 1, None))
-            time += 1
-            last_pid = -1
-
-    return processes, timeline
+def gantt_label(segment):
+    if segment.kind == "IDLE":
+        return None
+    if segment.kind == "IO":
+        return f"IO-P{segment.pid}"
+    return f"P{segment.pid}"
 
+def sjf_preemptive(processes):
+    processes, segments, _ = srtf(processes)
+    return processes, [(segment.start, segment.end, gantt_label(segment)) for segment in segments]
 
 
 def visualize_timeline(timeline, processes, canvas_frame, dynamic=False, manual=False, app_ref=None):
@@ -254,14 +195,10 @@ class SJFApp:
             final_processes, timeline = sjf_preemptive(processes)
             result = "PID | Arrival | Burst | I/O | Start | Completion | Turnaround | Waiting\n"
             result += "-" * 75 + "\n"
-            total_tat = total_wt = 0
             for p in final_processes:
-                total_tat += p.turnaround
-                total_wt += p.waiting
                 result += f"{p.pid:3} | {p.arrival:7} | {p.burst:5} | {p.io_burst:3} | {p.start:5} | {p.completion:10} | {p.turnaround:10} | {p.waiting:7}\n"
 
-            result += f"\nAverage Turnaround Time: {total_tat / self.num:.2f}"
-            result += f"\nAverage Waiting Time   : {total_wt / self.num:.2f}"
+            result += "\n" + format_summary(summarize_processes(final_processes))
 
             self.output_label.config(text=result)
 